@@ -4,12 +4,15 @@ import datetime
 import os
 from yaml import load, dump, Loader
 from numpy.testing import assert_equal
+import pytest
 
 from tracet.parse_xml import parsed_VOEvent
 from tracet.trigger_logic import (
     worth_observing_grb,
+    worth_observing_grb_many,
     worth_observing_nu,
     worth_observing_gw,
+    worth_observing_gw_many,
 )
 import voeventparse
 
@@ -95,6 +98,44 @@ def test_trigger_grb_event():
         assert_equal(decision_reason_log, exp_decision_reason_log)
 
 
+def test_trigger_grb_events_vectorised():
+    # Events that trigger, need a human, are outside the durations, have no duration,
+    # aren't a Fermi GRB and have a bad position
+    events = {
+        "event_duration": [0.5, 0.2, 5.0, None, 0.5, 0.5],
+        "fermi_most_likely_index": [4, 4, 4, 4, 3, 4],
+        "fermi_detection_prob": [60, 60, 60, 60, 60, 60],
+        "pos_error": [0.1, 0.1, 0.1, 0.1, 0.1, 0.0],
+    }
+    trigger_bool, debug_bool, pending_bool = worth_observing_grb_many(**events)
+
+    # Compare to making the decisions one at a time
+    for i in range(len(trigger_bool)):
+        (
+            exp_trigger_bool,
+            exp_debug_bool,
+            exp_pending_bool,
+            _,
+        ) = worth_observing_grb(**{key: values[i] for key, values in events.items()})
+        assert_equal(trigger_bool[i], exp_trigger_bool)
+        assert_equal(debug_bool[i], exp_debug_bool)
+        assert_equal(pending_bool[i], exp_pending_bool)
+    assert_equal(trigger_bool, [True, False, False, False, False, False])
+    assert_equal(pending_bool, [False, True, False, False, False, False])
+
+
+def test_trigger_grb_events_vectorised_bad_input():
+    # No event values at all
+    with pytest.raises(ValueError, match="At least one array"):
+        worth_observing_grb_many()
+    # Event values for different numbers of events
+    with pytest.raises(ValueError, match="same length"):
+        worth_observing_grb_many(
+            event_duration=[0.5, 0.2],
+            fermi_most_likely_index=[4, 4, 4],
+        )
+
+
 def test_trigger_nu_event():
     xml_tests = [
         # An antares neutrino we would want to trigger on
@@ -259,6 +300,79 @@ def test_trigger_gw_event():
         assert_equal(pending_bool, exp_pending_bool)
 
 
+def test_trigger_gw_events_vectorised():
+    # Events that trigger, are an early warning, are too old, only have one instrument,
+    # are a retraction, have too high a FAR and are likely terrestial
+    now = datetime.datetime.now(datetime.timezone.utc)
+    one_hour_ago = now - datetime.timedelta(hours=1)
+    four_hours_ago = now - datetime.timedelta(hours=4)
+    events = {
+        "telescope": ["LVC"] * 7,
+        "event_type": [
+            "Initial",
+            "EarlyWarning",
+            "Initial",
+            "Initial",
+            "Retraction",
+            "Initial",
+            "Initial",
+        ],
+        "event_observed": [
+            one_hour_ago,
+            one_hour_ago,
+            four_hours_ago,
+            one_hour_ago,
+            one_hour_ago,
+            one_hour_ago,
+            one_hour_ago,
+        ],
+        "lvc_instruments": ["H1,L1", "H1,L1", "H1,L1", "H1", "H1,L1", "H1,L1", "H1,L1"],
+        "lvc_false_alarm_rate": ["1e-9", None, "1e-9", "1e-9", "1e-9", "1e-7", "1e-9"],
+        "lvc_terrestial_probability": [0.0, None, 0.0, 0.0, 0.0, 0.0, 0.99],
+    }
+    thresholds = {
+        "maximum_false_alarm_rate": "1.00e-8",
+        "minimum_terrestial_probability": 0.0,
+        "maximum_terrestial_probability": 0.95,
+    }
+    trigger_bool, debug_bool, pending_bool = worth_observing_gw_many(
+        **events, **thresholds
+    )
+
+    # Compare to making the decisions one at a time
+    for i in range(len(trigger_bool)):
+        (exp_trigger_bool, exp_debug_bool, exp_pending_bool, _,) = worth_observing_gw(
+            **{key: values[i] for key, values in events.items()}, **thresholds
+        )
+        assert_equal(trigger_bool[i], exp_trigger_bool)
+        assert_equal(debug_bool[i], exp_debug_bool)
+        assert_equal(pending_bool[i], exp_pending_bool)
+    assert_equal(trigger_bool, [True, True, False, False, False, False, False])
+
+
+def test_trigger_gw_events_vectorised_bad_input():
+    one_hour_ago = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+        hours=1
+    )
+    # No event times
+    with pytest.raises(ValueError, match="event_observed"):
+        worth_observing_gw_many(telescope="LVC", event_type="Initial")
+    # Event values for different numbers of events
+    with pytest.raises(ValueError, match="same length"):
+        worth_observing_gw_many(
+            telescope="LVC",
+            event_type="Initial",
+            event_observed=[one_hour_ago, one_hour_ago],
+            lvc_terrestial_probability=[0.0],
+        )
+    with pytest.raises(ValueError, match="same length"):
+        worth_observing_gw_many(
+            telescope=["LVC", "LVC", "LVC"],
+            event_type="Initial",
+            event_observed=[one_hour_ago, one_hour_ago],
+        )
+
+
 if __name__ == "__main__":
     """
     Tests the trigger software that doesn't require the database
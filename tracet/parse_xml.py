@@ -7,9 +7,11 @@ from astropy.table import Table
 import astropy_healpix as ah
 import numpy as np
 import urllib.request
+from urllib.parse import urlsplit
 import os
 import uuid
 import pytz
+from functools import lru_cache
 
 import logging
 import datetime
@@ -36,6 +38,28 @@ SOURCE_TELESCOPES = {
     ],
 }
 
+# Frozen copies of SOURCE_TELESCOPES for membership tests (the lists keep their order
+# for the proposal form)
+SOURCE_TELESCOPE_SETS = {
+    source_type: frozenset(telescopes)
+    for source_type, telescopes in SOURCE_TELESCOPES.items()
+}
+
+# The telescope of each known ivorn stream (the part of the ivorn before the #)
+IVORN_STREAM_TELESCOPES = {
+    # Swift docs: https://gcn.gsfc.nasa.gov/swift.html
+    "ivo://nasa.gsfc.gcn/SWIFT": "SWIFT",
+    # Fermi docs: https://gcn.gsfc.nasa.gov/fermi.html
+    "ivo://nasa.gsfc.gcn/Fermi": "Fermi",
+    "ivo://nasa.gsfc.gcn/Antares_Alert": "Antares",
+    # AMON docs: https://gcn.gsfc.nasa.gov/gcn/amon.html
+    "ivo://nasa.gsfc.gcn/AMON": "AMON",
+    # MAXI docs: http://gcn.gsfc.nasa.gov/maxi.html
+    "ivo://nasa.gsfc.gcn/MAXI": "MAXI",
+    "ivo://gwnet/LVC": "LVC",
+    "ivo://HESS/GRB": "HESS",
+}
+
 
 def get_telescope(ivorn):
     """Check ivorn for the telescope name
@@ -50,34 +74,12 @@ def get_telescope(ivorn):
     telescope : `str`
         The telescope name.
     """
-
-    # Swift docs: https://gcn.gsfc.nasa.gov/swift.html
-    if ivorn.startswith("ivo://nasa.gsfc.gcn/SWIFT#"):
-        return "SWIFT"
-
-    # Fermi docs: https://gcn.gsfc.nasa.gov/fermi.html
-    if ivorn.startswith("ivo://nasa.gsfc.gcn/Fermi#"):
-        return "Fermi"
-
-    if ivorn.startswith("ivo://nasa.gsfc.gcn/Antares_Alert#"):
-        return "Antares"
-
-    # AMON docs: https://gcn.gsfc.nasa.gov/gcn/amon.html
-    if ivorn.startswith("ivo://nasa.gsfc.gcn/AMON#"):
-        return "AMON"
-
-    # MAXI docs: http://gcn.gsfc.nasa.gov/maxi.html
-    if ivorn.startswith("ivo://nasa.gsfc.gcn/MAXI#"):
-        return "MAXI"
-
-    if ivorn.startswith("ivo://gwnet/LVC#"):
-        return "LVC"
-
-    if ivorn.startswith("ivo://HESS/GRB#"):
-        return "HESS"
+    stream, hash_sep, _ = ivorn.partition("#")
+    if hash_sep and stream in IVORN_STREAM_TELESCOPES:
+        return IVORN_STREAM_TELESCOPES[stream]
 
     # Not found a know telescope so trying some simple logic
-    return str(ivorn.split("//")[1].split("/")[1].split("#")[0])
+    return urlsplit(ivorn).path.split("/")[1]
 
 
 def get_event_type(ivorn):
@@ -131,6 +133,27 @@ def load_swift_source_database():
     return df
 
 
+@lru_cache(maxsize=1)
+def get_flare_star_names():
+    """Load the MAXI and SWIFT flare star names from the files within the repo.
+
+    The names are cached so the files are only read once per process.
+
+    Returns
+    -------
+    flare_stars : `tuple`
+        The flare star names.
+    """
+    maxi_data_file = data_load.MAXI_FLARE_STAR_NAMES
+    with open(maxi_data_file, "r") as maxi_file:
+        maxi_flare_stars = [
+            a.strip().lower() for a in maxi_file.readlines() if not a.startswith("#")
+        ]
+    swift_df = load_swift_source_database()
+    swift_flare_stars = list(swift_df[swift_df["SRC_TYPE"] == "11"]["NAME"])
+    return tuple(maxi_flare_stars + swift_flare_stars)
+
+
 def get_source_types(telescope, event_type, source_name, v):
     """Predict what the source type of the event.
 
@@ -151,7 +174,7 @@ def get_source_types(telescope, event_type, source_name, v):
         Source typre of the event (GRB, FS, NU or GW).
     """
     # Check for Gravitational Waves
-    if telescope in SOURCE_TELESCOPES["GW"]:
+    if telescope in SOURCE_TELESCOPE_SETS["GW"]:
         return "GW"
 
     # Check for neutrinos
@@ -159,24 +182,13 @@ def get_source_types(telescope, event_type, source_name, v):
         return "NU"
 
     # Check for Flare Stars
-    maxi_data_file = data_load.MAXI_FLARE_STAR_NAMES
-    maxi_flare_stars = [
-        a.strip().lower()
-        for a in open(maxi_data_file, "r").readlines()
-        if not a.startswith("#")
-    ]
-    swift_df = load_swift_source_database()
-    swift_flare_stars = list(swift_df[swift_df["SRC_TYPE"] == "11"]["NAME"])
-    flare_stars = maxi_flare_stars + swift_flare_stars
     # Check if this is a sub_sub_threshold event and ignore if it is
     if telescope == "SWIFT" and "sub-sub-threshold" in str(v.What.Description):
         flare_star = False
     else:
-        flare_star = False
-        for f in flare_stars:
-            # Check if the name is within the "name" string since MAXI does stupid things sometimes
-            if f in str(source_name).lower():
-                flare_star = True
+        # Check if the name is within the "name" string since MAXI does stupid things sometimes
+        lower_source_name = str(source_name).lower()
+        flare_star = any(f in lower_source_name for f in get_flare_star_names())
     if flare_star:
         return "FS"
 
@@ -468,7 +480,7 @@ class parsed_VOEvent:
 
         # Get current position
         self.ra, self.dec, self.err = get_position_info(v)
-        print(f"DEBUG - ra: {self.ra}, dec: {self.dec}")
+        logger.debug("ra: %s, dec: %s", self.ra, self.dec)
         if self.ra is None or self.dec is None:
             self.ra_hms = None
             self.dec_dms = None
@@ -490,7 +502,7 @@ class parsed_VOEvent:
             self.ignore = False
         else:
             # Unknown telescope so ignoring
-            print(f"Unknown telescope so ignoring {this_pair}")
+            logger.debug("Unknown telescope so ignoring %s", this_pair)
             self.ignore = True
             return
         # Parse trigger info (telescope dependent)
@@ -606,7 +618,6 @@ class parsed_VOEvent:
                 self.lvc_instruments = str(
                     v.find(".//Param[@name='Instruments']").attrib["value"]
                 )
-                print(v.find(".//Param[@name='Instruments']").attrib["value"])
 
             lvc_skymap_fits = v.find(".//Param[@name='skymap_fits']")
 
@@ -630,7 +641,7 @@ class parsed_VOEvent:
             if not v.find(".//Param[@name='isRealAlert']").attrib["value"]:
                 # Not a real alert so ignore
                 self.ignore = True
-                print("Not a real alert so ignore")
+                logger.debug("Not a real alert so ignore")
 
         logger.debug("Trig details:")
         logger.debug(f"Dur:  {self.event_duration} s")
@@ -1,10 +1,15 @@
 import datetime
 import logging
 
+import numpy as np
 import pytz
 
 logger = logging.getLogger(__name__)
 
+UTC = datetime.timezone.utc
+# GW alerts later than this after the event are not observed
+TWO_HOURS = datetime.timedelta(hours=2)
+
 
 def worth_observing_grb(
     # event values
@@ -77,55 +82,72 @@ def worth_observing_grb(
     decision_reason_log : `str`
         A log of all the decisions made so far so a user can understand why the source was(n't) observed.
     """
-    print('DEBUG - worth_observing_grb')
     # Setup up defaults
     trigger_bool = False
     debug_bool = False
     pending_bool = False
+    # Collect the log lines and join them once at the end
+    reason_log = [decision_reason_log]
+    # Timestamp and event prefix for all the log lines of this decision
+    log_prefix = f"{datetime.datetime.utcnow()}: Event ID {event_id}: "
 
     if pos_error == 0.0:
         # Ignore the inaccurate event
         debug_bool = True
-        decision_reason_log = f"{decision_reason_log}{datetime.datetime.utcnow()}: Event ID {event_id}: The Events positions uncertainty is 0.0 which is likely an error so not observing. \n"
+        reason_log.append(
+            f"{log_prefix}The Events positions uncertainty is 0.0 which is likely an error so not observing. \n"
+        )
     elif maximum_position_uncertainty and (pos_error > maximum_position_uncertainty):
         # Ignore the inaccurate event
         debug_bool = True
-        decision_reason_log = f"{decision_reason_log}{datetime.datetime.utcnow()}: Event ID {event_id}: The Events positions uncertainty ({pos_error:.4f} deg) is greater than {maximum_position_uncertainty:.4f} so not observing. \n"
-    elif (
-        proposal_telescope_id == "ATCA"
-        and not (dec > atca_dec_min_1 and dec < atca_dec_max_1)
-        and not (dec > atca_dec_min_2 and dec < atca_dec_max_2)
+        reason_log.append(
+            f"{log_prefix}The Events positions uncertainty ({pos_error:.4f} deg) is greater than {maximum_position_uncertainty:.4f} so not observing. \n"
+        )
+    elif proposal_telescope_id == "ATCA" and not (
+        atca_dec_min_1 < dec < atca_dec_max_1 or atca_dec_min_2 < dec < atca_dec_max_2
     ):
         # Ignore the inaccurate event
         debug_bool = True
-        decision_reason_log = f"{decision_reason_log}{datetime.datetime.utcnow()}: Event ID {event_id}: The Events declination ({ dec }) is outside limit 1 ({ atca_dec_min_1 } < dec < {atca_dec_max_1}) or limit 2 ({ atca_dec_min_2 } < dec < {atca_dec_max_2}). \n"
+        reason_log.append(
+            f"{log_prefix}The Events declination ({ dec }) is outside limit 1 ({ atca_dec_min_1 } < dec < {atca_dec_max_1}) or limit 2 ({ atca_dec_min_2 } < dec < {atca_dec_max_2}). \n"
+        )
+    if debug_bool:
+        # The position can't be observed so skip the likelihood and duration checks
+        return trigger_bool, debug_bool, pending_bool, "".join(reason_log)
+
     # Check the events likelyhood data
     likely_bool = False
     if fermi_most_likely_index is not None:
         # Fermi triggers have their own probability
         if fermi_most_likely_index == 4:
             logger.debug("MOST_LIKELY = GRB")
-            print('DEBUG - MOST_LIKELY = GRB')
             # ignore things that don't reach our probability threshold
             if fermi_detection_prob >= fermi_min_detection_prob:
                 likely_bool = True
-                decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: Fermi GRB probability greater than {fermi_min_detection_prob}. \n"
+                reason_log.append(
+                    f"{log_prefix}Fermi GRB probability greater than {fermi_min_detection_prob}. \n"
+                )
             else:
                 debug_bool = True
-                decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: Fermi GRB probability less than {fermi_min_detection_prob} so not triggering. \n"
+                reason_log.append(
+                    f"{log_prefix}Fermi GRB probability less than {fermi_min_detection_prob} so not triggering. \n"
+                )
         else:
             logger.debug("MOST LIKELY != GRB")
-            print('DEBUG - MOST LIKELY != GRB')
             debug_bool = False
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: Fermi GRB likely index not 4. \n"
+            reason_log.append(f"{log_prefix}Fermi GRB likely index not 4. \n")
     elif swift_rate_signif is not None:
         # Swift has a rate signif in sigmas
         if swift_rate_signif >= swift_min_rate_signif:
             likely_bool = True
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: SWIFT rate significance ({swift_rate_signif}) >= swift_min_rate ({swift_min_rate_signif:.3f}) sigma. \n"
+            reason_log.append(
+                f"{log_prefix}SWIFT rate significance ({swift_rate_signif}) >= swift_min_rate ({swift_min_rate_signif:.3f}) sigma. \n"
+            )
         else:
             debug_bool = True
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: SWIFT rate significance ({swift_rate_signif}) < swift_min_rate ({swift_min_rate_signif:.3f}) sigma so not triggering. \n"
+            reason_log.append(
+                f"{log_prefix}SWIFT rate significance ({swift_rate_signif}) < swift_min_rate ({swift_min_rate_signif:.3f}) sigma so not triggering. \n"
+            )
 
     elif hess_significance is not None:
         if (
@@ -133,35 +155,201 @@ def worth_observing_grb(
             and hess_significance >= minimum_hess_significance
         ):
             likely_bool = True
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: HESS rate significance is {minimum_hess_significance} <= ({hess_significance:.3f}) <= {maximum_hess_significance} sigma. \n"
+            reason_log.append(
+                f"{log_prefix}HESS rate significance is {minimum_hess_significance} <= ({hess_significance:.3f}) <= {maximum_hess_significance} sigma. \n"
+            )
         else:
             debug_bool = True
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: Event ID {event_id}: HESS rate significance is not {minimum_hess_significance} <= ({hess_significance:.3f}) <= {maximum_hess_significance} so not triggering. \n"
+            reason_log.append(
+                f"{log_prefix}Event ID {event_id}: HESS rate significance is not {minimum_hess_significance} <= ({hess_significance:.3f}) <= {maximum_hess_significance} so not triggering. \n"
+            )
     else:
         likely_bool = True
-        decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: No probability metric given so assume it is a GRB. \n"
+        reason_log.append(
+            f"{log_prefix}No probability metric given so assume it is a GRB. \n"
+        )
+    if debug_bool:
+        # The likelihood check rejected the event so don't check the duration
+        return trigger_bool, debug_bool, pending_bool, "".join(reason_log)
+
     # Check the duration of the event
-    if event_any_duration and likely_bool and not debug_bool:
+    if event_any_duration and likely_bool:
         trigger_bool = True
-        decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: Accepting any event duration so triggering. \n"
-    elif not event_any_duration and event_duration is None and not debug_bool:
+        reason_log.append(f"{log_prefix}Accepting any event duration so triggering. \n")
+    elif not event_any_duration and event_duration is None:
         debug_bool = True
-        decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: No event duration (None) so not triggering. \n"
-    elif event_duration is not None and likely_bool and not debug_bool:
+        reason_log.append(f"{log_prefix}No event duration (None) so not triggering. \n")
+    elif event_duration is not None and likely_bool:
         if event_min_duration <= event_duration <= event_max_duration:
             trigger_bool = True
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: Event duration between {event_min_duration} and {event_max_duration} s so triggering. \n"
+            reason_log.append(
+                f"{log_prefix}Event duration between {event_min_duration} and {event_max_duration} s so triggering. \n"
+            )
         elif pending_min_duration_1 <= event_duration <= pending_max_duration_1:
             pending_bool = True
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: Event duration between {pending_min_duration_1} and {pending_max_duration_1} s so waiting for a human's decision. \n"
+            reason_log.append(
+                f"{log_prefix}Event duration between {pending_min_duration_1} and {pending_max_duration_1} s so waiting for a human's decision. \n"
+            )
         elif pending_min_duration_2 <= event_duration <= pending_max_duration_2:
             pending_bool = True
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: Event duration between {pending_min_duration_2} and {pending_max_duration_2} s so waiting for a human's decision. \n"
+            reason_log.append(
+                f"{log_prefix}Event duration between {pending_min_duration_2} and {pending_max_duration_2} s so waiting for a human's decision. \n"
+            )
         else:
             debug_bool = True
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: Event duration outside of all time ranges so not triggering. \n"
+            reason_log.append(
+                f"{log_prefix}Event duration outside of all time ranges so not triggering. \n"
+            )
 
-    return trigger_bool, debug_bool, pending_bool, decision_reason_log
+    return trigger_bool, debug_bool, pending_bool, "".join(reason_log)
+
+
+def worth_observing_grb_many(
+    # event values
+    event_duration=None,
+    fermi_most_likely_index=None,
+    fermi_detection_prob=None,
+    swift_rate_signif=None,
+    hess_significance=None,
+    pos_error=None,
+    dec=None,
+    # Thresholds
+    event_any_duration=False,
+    event_min_duration=0.256,
+    event_max_duration=1.023,
+    pending_min_duration_1=0.124,
+    pending_max_duration_1=0.255,
+    pending_min_duration_2=1.024,
+    pending_max_duration_2=2.048,
+    fermi_min_detection_prob=50,
+    swift_min_rate_signif=0.0,
+    minimum_hess_significance=0.0,
+    maximum_hess_significance=1.0,
+    maximum_position_uncertainty=None,
+    atca_dec_min_1=None,
+    atca_dec_max_1=None,
+    atca_dec_min_2=None,
+    atca_dec_max_2=None,
+    # Other
+    proposal_telescope_id=None,
+):
+    """Decide which of many GRB Events are worth observing in a single vectorised pass.
+
+    Makes the same decisions as worth_observing_grb for each event, which is useful for
+    replaying archival events against a proposal's thresholds. No decision log is made.
+
+    Parameters
+    ----------
+    event_duration, fermi_most_likely_index, fermi_detection_prob, swift_rate_signif, hess_significance, pos_error, dec : `array_like`, optional
+        The event values (see worth_observing_grb) with one entry per event. None (or None entries) are treated as missing values.
+    event_any_duration, ..., proposal_telescope_id : optional
+        The thresholds, see worth_observing_grb.
+
+    Returns
+    -------
+    trigger_bool : `numpy.ndarray`
+        True for events where an observation should be triggered.
+    debug_bool : `numpy.ndarray`
+        True for events where a debug alert should be sent out.
+    pending_bool : `numpy.ndarray`
+        True for events where a pending observation should wait for human intervention.
+
+    Raises
+    ------
+    ValueError
+        If no event values are given or the arrays of event values have different lengths.
+    """
+    event_values = (
+        event_duration,
+        fermi_most_likely_index,
+        fermi_detection_prob,
+        swift_rate_signif,
+        hess_significance,
+        pos_error,
+        dec,
+    )
+    lengths = {len(values) for values in event_values if values is not None}
+    if not lengths:
+        raise ValueError("At least one array of event values must be given.")
+    if len(lengths) > 1:
+        raise ValueError(
+            f"The arrays of event values must be the same length, got lengths {sorted(lengths)}."
+        )
+    nevents = lengths.pop()
+    (
+        event_duration,
+        fermi_most_likely_index,
+        fermi_detection_prob,
+        swift_rate_signif,
+        hess_significance,
+        pos_error,
+        dec,
+    ) = (
+        np.full(nevents, np.nan) if values is None else np.array(values, dtype=float)
+        for values in event_values
+    )
+
+    # Check the position
+    debug_bool = pos_error == 0.0
+    if maximum_position_uncertainty:
+        debug_bool |= pos_error > maximum_position_uncertainty
+    if proposal_telescope_id == "ATCA":
+        # Check every event against both declination windows at once
+        dec_windows = np.array(
+            [[atca_dec_min_1, atca_dec_max_1], [atca_dec_min_2, atca_dec_max_2]],
+            dtype=float,
+        )
+        in_dec_window = (dec[:, np.newaxis] > dec_windows[:, 0]) & (
+            dec[:, np.newaxis] < dec_windows[:, 1]
+        )
+        debug_bool |= ~in_dec_window.any(axis=1)
+
+    # Check the events likelyhood data, Fermi then SWIFT then HESS
+    has_fermi = ~np.isnan(fermi_most_likely_index)
+    has_swift = ~has_fermi & ~np.isnan(swift_rate_signif)
+    has_hess = ~has_fermi & ~has_swift & ~np.isnan(hess_significance)
+    fermi_grb = has_fermi & (fermi_most_likely_index == 4)
+    fermi_likely = fermi_detection_prob >= fermi_min_detection_prob
+    swift_likely = swift_rate_signif >= swift_min_rate_signif
+    hess_likely = (hess_significance <= maximum_hess_significance) & (
+        hess_significance >= minimum_hess_significance
+    )
+    likely_bool = (
+        (fermi_grb & fermi_likely)
+        | (has_swift & swift_likely)
+        | (has_hess & hess_likely)
+        | ~(has_fermi | has_swift | has_hess)
+    )
+    debug_bool |= (
+        (fermi_grb & ~fermi_likely)
+        | (has_swift & ~swift_likely)
+        | (has_hess & ~hess_likely)
+    )
+
+    # Check the duration of the event
+    check_duration = ~debug_bool & likely_bool
+    if event_any_duration:
+        trigger_bool = check_duration
+        pending_bool = np.zeros(nevents, dtype=bool)
+    else:
+        has_duration = ~np.isnan(event_duration)
+        debug_bool |= ~has_duration
+        check_duration &= has_duration
+        in_trigger_range = (event_min_duration <= event_duration) & (
+            event_duration <= event_max_duration
+        )
+        in_pending_range = (
+            (pending_min_duration_1 <= event_duration)
+            & (event_duration <= pending_max_duration_1)
+        ) | (
+            (pending_min_duration_2 <= event_duration)
+            & (event_duration <= pending_max_duration_2)
+        )
+        trigger_bool = check_duration & in_trigger_range
+        pending_bool = check_duration & ~in_trigger_range & in_pending_range
+        debug_bool |= check_duration & ~in_trigger_range & ~in_pending_range
+
+    return trigger_bool, debug_bool, pending_bool
 
 
 def worth_observing_nu(
@@ -204,20 +392,30 @@ def worth_observing_nu(
     trigger_bool = False
     debug_bool = False
     pending_bool = False
+    # Collect the log lines and join them once at the end
+    reason_log = [decision_reason_log]
+    # Timestamp and event prefix for all the log lines of this decision
+    log_prefix = f"{datetime.datetime.utcnow()}: Event ID {event_id}: "
 
     if telescope == "Antares":
         # Check the Antares ranking
         if antares_ranking <= antares_min_ranking:
             trigger_bool = True
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The Antares ranking ({antares_ranking}) is less than or equal to {antares_min_ranking} so triggering. \n"
+            reason_log.append(
+                f"{log_prefix}The Antares ranking ({antares_ranking}) is less than or equal to {antares_min_ranking} so triggering. \n"
+            )
         else:
             debug_bool = True
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The Antares ranking ({antares_ranking}) is greater than {antares_min_ranking} so not triggering. \n"
+            reason_log.append(
+                f"{log_prefix}The Antares ranking ({antares_ranking}) is greater than {antares_min_ranking} so not triggering. \n"
+            )
     else:
         trigger_bool = True
-        decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: No thresholds for non Antares telescopes so triggering. \n"
+        reason_log.append(
+            f"{log_prefix}No thresholds for non Antares telescopes so triggering. \n"
+        )
 
-    return trigger_bool, debug_bool, pending_bool, decision_reason_log
+    return trigger_bool, debug_bool, pending_bool, "".join(reason_log)
 
 
 def worth_observing_gw(
@@ -246,7 +444,7 @@ def worth_observing_gw(
     maximum_false_alarm_rate=None,
     # Other
     decision_reason_log="",
-    event_observed=datetime.datetime.now(datetime.timezone.utc),
+    event_observed=datetime.datetime.now(UTC),
     event_id=None,
     lvc_instruments=None,
 ):
@@ -309,6 +507,11 @@ def worth_observing_gw(
     trigger_bool = False
     debug_bool = False
     pending_bool = False
+    # Collect the log lines and join them once at the end
+    reason_log = [decision_reason_log]
+    # One timestamp for the log lines and the event time check of this decision
+    now = datetime.datetime.now(UTC)
+    log_prefix = f"{now.replace(tzinfo=None)}: Event ID {event_id}: "
 
     # For debugging timezone aware
     # def is_timezone_aware(dt):
@@ -316,23 +519,12 @@ def worth_observing_gw(
     #     # Returns True if the datetime object is timezone aware, False otherwise.
     #     return dt.tzinfo is not None and dt.tzinfo.utcoffset(dt) is not None
 
-    # Get exponent
-    # lvc_false_alarm_rate = None | "3.218261352069347-10" | "0.0001"
-    if lvc_false_alarm_rate and maximum_false_alarm_rate:
-        try:
-            FAR = float(lvc_false_alarm_rate)
-            FARThreshold = float(maximum_false_alarm_rate)
-        except Exception as e:
-            debug_bool = True
-            decision_reason_log += f'{datetime.datetime.utcnow()}: Event ID {event_id}: The event FAR ({lvc_false_alarm_rate}) or proposal FAR ({maximum_false_alarm_rate}) could not be processed so not triggering. \n'
-
-    print(f"\nLogic event_type: {event_type}")
-    print(f"\nLogic lvc_instruments: {lvc_instruments}")
+    logger.debug(
+        "Logic event_type: %s, lvc_instruments: %s", event_type, lvc_instruments
+    )
 
     # Check alert is less than 2 hours from the event time
-    two_hours_ago = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
-        hours=2
-    )
+    two_hours_ago = now - TWO_HOURS
 
     if telescope == "LVC" and event_type == "EarlyWarning":
         trigger_bool = True  # Always trigger on Early Warning events
@@ -345,100 +537,276 @@ def worth_observing_gw(
         trigger_bool = (
             False  # don't trigger if the event was earlier than two_hours_ago
         )
-        decision_reason_log += f'{datetime.datetime.utcnow()}: Event ID {event_id}: The event time {event_observed.strftime("%Y-%m-%dT%H:%M:%S+0000")} is more than 2 hours ago {two_hours_ago.strftime("%Y-%m-%dT%H:%M:%S+0000")} so not triggering. \n'
-    elif lvc_instruments != None and len(lvc_instruments.split(',')) < 2:
+        reason_log.append(
+            f'{log_prefix}The event time {event_observed.strftime("%Y-%m-%dT%H:%M:%S+0000")} is more than 2 hours ago {two_hours_ago.strftime("%Y-%m-%dT%H:%M:%S+0000")} so not triggering. \n'
+        )
+    elif lvc_instruments is not None and "," not in lvc_instruments:
         debug_bool = True
-        decision_reason_log += f'{datetime.datetime.utcnow()}: Event ID {event_id}: The event has only {lvc_instruments} so not triggering. \n'
+        reason_log.append(
+            f"{log_prefix}The event has only {lvc_instruments} so not triggering. \n"
+        )
     elif telescope == "LVC" and event_type == "Retraction":
         debug_bool = True
-        decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: Retraction, scheduling no capture observation (WIP, ignoring for now). \n"
+        reason_log.append(
+            f"{log_prefix}Retraction, scheduling no capture observation (WIP, ignoring for now). \n"
+        )
     elif telescope == "LVC":
+        # Only parse the FARs once the cheaper time, instrument and retraction
+        # checks have passed
+        # lvc_false_alarm_rate = None | "3.218261352069347-10" | "0.0001"
+        FAR = FARThreshold = None
+        if lvc_false_alarm_rate and maximum_false_alarm_rate:
+            try:
+                FAR = float(lvc_false_alarm_rate)
+                FARThreshold = float(maximum_false_alarm_rate)
+            except Exception as e:
+                trigger_bool = False
+                debug_bool = True
+                reason_log.append(
+                    f"{log_prefix}The event FAR ({lvc_false_alarm_rate}) or proposal FAR ({maximum_false_alarm_rate}) could not be processed so not triggering. \n"
+                )
 
-        # PROB_NS
-        if lvc_false_alarm_rate and maximum_false_alarm_rate and FAR > FARThreshold:
+        # The event probabilities in the order they are checked, with their limits
+        probability_limits = (
+            (
+                "PROB_NS",
+                lvc_includes_neutron_star_probability,
+                minimum_neutron_star_probability,
+                maximum_neutron_star_probability,
+            ),
+            (
+                "PROB_BNS",
+                lvc_binary_neutron_star_probability,
+                minimum_binary_neutron_star_probability,
+                maximum_binary_neutron_star_probability,
+            ),
+            (
+                "PROB_NSBH",
+                lvc_neutron_star_black_hole_probability,
+                minimum_neutron_star_black_hole_probability,
+                maximum_neutron_star_black_hole_probability,
+            ),
+            (
+                "PROB_BBH",
+                lvc_binary_black_hole_probability,
+                minimum_binary_black_hole_probability,
+                maximum_binary_black_hole_probability,
+            ),
+            (
+                "PROB_Terre",
+                lvc_terrestial_probability,
+                minimum_terrestial_probability,
+                maximum_terrestial_probability,
+            ),
+        )
+
+        if not debug_bool and FAR is not None and FAR > FARThreshold:
             debug_bool = True
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The FAR is {lvc_false_alarm_rate} which is less than {maximum_false_alarm_rate} so not triggering. \n"
-        elif lvc_includes_neutron_star_probability and (
-            lvc_includes_neutron_star_probability > maximum_neutron_star_probability
-            or lvc_includes_neutron_star_probability < minimum_neutron_star_probability
-        ):
-            if lvc_includes_neutron_star_probability > maximum_neutron_star_probability:
-                debug_bool = True
-                decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The PROB_NS probability ({lvc_includes_neutron_star_probability}) is greater than {maximum_neutron_star_probability} so not triggering. \n"
-            elif (
-                lvc_includes_neutron_star_probability < minimum_neutron_star_probability
-            ):
-                debug_bool = True
-                decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The PROB_NS probability ({lvc_includes_neutron_star_probability}) is less than {minimum_neutron_star_probability} so not triggering. \n"
-        elif lvc_binary_neutron_star_probability and (
-            lvc_binary_neutron_star_probability
-            > maximum_binary_neutron_star_probability
-            or lvc_binary_neutron_star_probability
-            < minimum_binary_neutron_star_probability
-        ):
-            if (
-                lvc_binary_neutron_star_probability
-                > maximum_binary_neutron_star_probability
-            ):
-                debug_bool = True
-                decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The PROB_BNS probability ({lvc_binary_neutron_star_probability}) is greater than {maximum_binary_neutron_star_probability} so not triggering. \n"
-            elif (
-                lvc_binary_neutron_star_probability
-                < minimum_binary_neutron_star_probability
-            ):
-                debug_bool = True
-                decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The PROB_BNS probability ({lvc_binary_neutron_star_probability}) is less than {minimum_binary_neutron_star_probability} so not triggering. \n"
-        elif lvc_neutron_star_black_hole_probability and (
-            lvc_neutron_star_black_hole_probability
-            > maximum_neutron_star_black_hole_probability
-            or lvc_neutron_star_black_hole_probability
-            < minimum_neutron_star_black_hole_probability
-        ):
-            if (
-                lvc_neutron_star_black_hole_probability
-                > maximum_neutron_star_black_hole_probability
-            ):
-                debug_bool = True
-                decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The PROB_NSBH probability ({lvc_neutron_star_black_hole_probability}) is greater than {maximum_neutron_star_black_hole_probability} so not triggering. \n"
-            elif (
-                lvc_neutron_star_black_hole_probability
-                < minimum_neutron_star_black_hole_probability
-            ):
-                debug_bool = True
-                decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The PROB_NSBH probability ({lvc_neutron_star_black_hole_probability}) is less than {minimum_neutron_star_black_hole_probability} so not triggering. \n"
-        elif lvc_binary_black_hole_probability and (
-            lvc_binary_black_hole_probability > maximum_binary_black_hole_probability
-            or lvc_binary_black_hole_probability < minimum_binary_black_hole_probability
-        ):
-            if (
-                lvc_binary_black_hole_probability
-                > maximum_binary_black_hole_probability
-            ):
-                debug_bool = True
-                decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The PROB_BBH probability ({lvc_binary_black_hole_probability}) is greater than {maximum_binary_black_hole_probability} so not triggering. \n"
-            elif (
-                lvc_binary_black_hole_probability
-                < minimum_binary_black_hole_probability
-            ):
-                debug_bool = True
-                decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The PROB_BBH probability ({lvc_binary_black_hole_probability}) is less than {minimum_binary_black_hole_probability} so not triggering. \n"
-        elif lvc_terrestial_probability and (
-            lvc_terrestial_probability > maximum_terrestial_probability
-            or lvc_terrestial_probability < minimum_terrestial_probability
-        ):
-            if lvc_terrestial_probability > maximum_terrestial_probability:
-                debug_bool = True
-                decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The PROB_Terre probability ({lvc_terrestial_probability}) is greater than {maximum_terrestial_probability} so not triggering. \n"
-            elif lvc_terrestial_probability < minimum_terrestial_probability:
-                debug_bool = True
-                decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The PROB_Terre probability ({lvc_terrestial_probability}) is less than {minimum_terrestial_probability} so not triggering. \n"
+            reason_log.append(
+                f"{log_prefix}The FAR is {lvc_false_alarm_rate} which is less than {maximum_false_alarm_rate} so not triggering. \n"
+            )
+        if not debug_bool:
+            # Stop at the first probability outside of its limits
+            for name, probability, minimum, maximum in probability_limits:
+                if not probability:
+                    continue
+                if probability > maximum:
+                    debug_bool = True
+                    reason_log.append(
+                        f"{log_prefix}The {name} probability ({probability}) is greater than {maximum} so not triggering. \n"
+                    )
+                    break
+                if probability < minimum:
+                    debug_bool = True
+                    reason_log.append(
+                        f"{log_prefix}The {name} probability ({probability}) is less than {minimum} so not triggering. \n"
+                    )
+                    break
 
-        elif lvc_significant == True and not observe_significant:
+        if debug_bool:
+            # Already rejected by the FAR or probability checks
+            pass
+        elif lvc_significant and not observe_significant:
             debug_bool = True
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The GW significance ({lvc_significant}) is not observed because observe_significant is {observe_significant}. \n"
+            reason_log.append(
+                f"{log_prefix}The GW significance ({lvc_significant}) is not observed because observe_significant is {observe_significant}. \n"
+            )
 
         else:
             trigger_bool = True
-            decision_reason_log += f"{datetime.datetime.utcnow()}: Event ID {event_id}: The probability looks good so triggering. \n"
+            reason_log.append(
+                f"{log_prefix}The probability looks good so triggering. \n"
+            )
+
+    return trigger_bool, debug_bool, pending_bool, "".join(reason_log)
+
+
+def worth_observing_gw_many(
+    # event values
+    telescope=None,
+    lvc_significant=None,
+    lvc_binary_neutron_star_probability=None,
+    lvc_neutron_star_black_hole_probability=None,
+    lvc_binary_black_hole_probability=None,
+    lvc_terrestial_probability=None,
+    lvc_includes_neutron_star_probability=None,
+    lvc_false_alarm_rate=None,
+    event_type=None,
+    event_observed=None,
+    lvc_instruments=None,
+    # Thresholds
+    minimum_neutron_star_probability=0.01,
+    maximum_neutron_star_probability=1.0,
+    minimum_binary_neutron_star_probability=0.01,
+    maximum_binary_neutron_star_probability=1.0,
+    minimum_neutron_star_black_hole_probability=0.01,
+    maximum_neutron_star_black_hole_probability=1.0,
+    minimum_binary_black_hole_probability=0.01,
+    maximum_binary_black_hole_probability=1.0,
+    minimum_terrestial_probability=0.95,
+    maximum_terrestial_probability=0.95,
+    observe_significant=True,
+    maximum_false_alarm_rate=None,
+):
+    """Decide which of many Gravity Wave Events are worth observing in a single vectorised pass.
+
+    Makes the same decisions as worth_observing_gw for each event, which is useful for
+    replaying archival events against a proposal's thresholds. No decision log is made.
+
+    Parameters
+    ----------
+    telescope, event_type : `str` or `array_like`, optional
+        The telescope and event type (see worth_observing_gw), either one for all events or one entry per event.
+    lvc_significant, lvc_binary_neutron_star_probability, ..., lvc_false_alarm_rate, lvc_instruments : `array_like`, optional
+        The event values (see worth_observing_gw) with one entry per event. None (or None entries) are treated as missing values.
+        The false alarm rates must be numbers or strings that can be converted to a float.
+    event_observed : `array_like`
+        The timezone aware time of each event.
+    minimum_neutron_star_probability, ..., maximum_false_alarm_rate : optional
+        The thresholds, see worth_observing_gw.
+
+    Returns
+    -------
+    trigger_bool : `numpy.ndarray`
+        True for events where an observation should be triggered.
+    debug_bool : `numpy.ndarray`
+        True for events where a debug alert should be sent out.
+    pending_bool : `numpy.ndarray`
+        True for events where a pending observation should wait for human intervention.
+
+    Raises
+    ------
+    ValueError
+        If event_observed isn't given or the arrays of event values have different lengths.
+    """
+    if event_observed is None:
+        raise ValueError("The event_observed time of each event must be given.")
+    nevents = len(event_observed)
+    event_values = {
+        "lvc_significant": lvc_significant,
+        "lvc_binary_neutron_star_probability": lvc_binary_neutron_star_probability,
+        "lvc_neutron_star_black_hole_probability": lvc_neutron_star_black_hole_probability,
+        "lvc_binary_black_hole_probability": lvc_binary_black_hole_probability,
+        "lvc_terrestial_probability": lvc_terrestial_probability,
+        "lvc_includes_neutron_star_probability": lvc_includes_neutron_star_probability,
+        "lvc_false_alarm_rate": lvc_false_alarm_rate,
+        "lvc_instruments": lvc_instruments,
+    }
+    # The telescope and event type can also be a single value for all events
+    for name, values in (("telescope", telescope), ("event_type", event_type)):
+        if not isinstance(values, str):
+            event_values[name] = values
+    for name, values in event_values.items():
+        if values is not None and len(values) != nevents:
+            raise ValueError(
+                f"The arrays of event values must be the same length, {name} has {len(values)} values but event_observed has {nevents}."
+            )
+    (
+        lvc_binary_neutron_star_probability,
+        lvc_neutron_star_black_hole_probability,
+        lvc_binary_black_hole_probability,
+        lvc_terrestial_probability,
+        lvc_includes_neutron_star_probability,
+        lvc_false_alarm_rate,
+    ) = (
+        np.full(nevents, np.nan) if values is None else np.array(values, dtype=float)
+        for values in (
+            lvc_binary_neutron_star_probability,
+            lvc_neutron_star_black_hole_probability,
+            lvc_binary_black_hole_probability,
+            lvc_terrestial_probability,
+            lvc_includes_neutron_star_probability,
+            lvc_false_alarm_rate,
+        )
+    )
+    is_lvc = np.broadcast_to(np.asarray(telescope) == "LVC", nevents)
+    event_type = np.asarray(event_type)
+
+    # Early warnings always trigger and are assumed to be binary neutron stars
+    early_warning = is_lvc & (event_type == "EarlyWarning")
+    trigger_bool = early_warning.copy()
+    lvc_binary_neutron_star_probability[early_warning] = 0.97
+    lvc_neutron_star_black_hole_probability[early_warning] = 0.01
+    lvc_binary_black_hole_probability[early_warning] = 0.01
+    lvc_terrestial_probability[early_warning] = 0.01
+
+    # Check the alerts are less than 2 hours from the event time
+    two_hours_ago = (datetime.datetime.now(UTC) - TWO_HOURS).timestamp()
+    too_late = (
+        np.array([observed.timestamp() for observed in event_observed]) < two_hours_ago
+    )
+    trigger_bool &= ~too_late
+    if lvc_instruments is None:
+        single_instrument = np.zeros(nevents, dtype=bool)
+    else:
+        single_instrument = np.array(
+            [
+                instruments is not None and "," not in instruments
+                for instruments in lvc_instruments
+            ]
+        )
+    retraction = is_lvc & (event_type == "Retraction")
+    debug_bool = too_late | single_instrument | retraction
+
+    # Only the remaining LVC events are checked against the FAR and probabilities
+    check_lvc = is_lvc & ~debug_bool
+    rejected = np.zeros(nevents, dtype=bool)
+    if maximum_false_alarm_rate:
+        rejected |= lvc_false_alarm_rate > float(maximum_false_alarm_rate)
+    for probability, minimum, maximum in (
+        (
+            lvc_includes_neutron_star_probability,
+            minimum_neutron_star_probability,
+            maximum_neutron_star_probability,
+        ),
+        (
+            lvc_binary_neutron_star_probability,
+            minimum_binary_neutron_star_probability,
+            maximum_binary_neutron_star_probability,
+        ),
+        (
+            lvc_neutron_star_black_hole_probability,
+            minimum_neutron_star_black_hole_probability,
+            maximum_neutron_star_black_hole_probability,
+        ),
+        (
+            lvc_binary_black_hole_probability,
+            minimum_binary_black_hole_probability,
+            maximum_binary_black_hole_probability,
+        ),
+        (
+            lvc_terrestial_probability,
+            minimum_terrestial_probability,
+            maximum_terrestial_probability,
+        ),
+    ):
+        # Missing and zero probabilities aren't checked
+        rejected |= (probability != 0) & (
+            (probability > maximum) | (probability < minimum)
+        )
+    if not observe_significant and lvc_significant is not None:
+        rejected |= np.array(lvc_significant, dtype=bool)
+    debug_bool |= check_lvc & rejected
+    trigger_bool |= check_lvc & ~rejected
 
-    return trigger_bool, debug_bool, pending_bool, decision_reason_log
+    return trigger_bool, debug_bool, np.zeros(nevents, dtype=bool)
@@ -16,7 +16,7 @@ from .models import (
     Observations,
     EventGroup,
 )
-from .telescope_observe import trigger_observation
+from .telescope_observe import trigger_observation, get_earth_location
 from operator import itemgetter
 from tracet.trigger_logic import (
     worth_observing_grb,
@@ -25,11 +25,12 @@ from tracet.trigger_logic import (
 )
 
 import os
+from functools import lru_cache
 from twilio.rest import Client
 import datetime
 from astropy import units as u
 from astropy.time import Time
-from astropy.coordinates import SkyCoord, EarthLocation, AltAz
+from astropy.coordinates import SkyCoord, AltAz
 import numpy as np
 from scipy.stats import norm
 
@@ -42,10 +43,16 @@ auth_token = os.environ.get("TWILIO_AUTH_TOKEN", None)
 my_number = os.environ.get("TWILIO_PHONE_NUMBER", None)
 
 
+@lru_cache(maxsize=1)
+def get_twilio_client():
+    """Set up the twilio client for SMS and calls once and share it between alerts."""
+    return Client(account_sid, auth_token)
+
+
 @receiver(post_save, sender=Event)
 def group_trigger(sender, instance, **kwargs):
     """Check if the latest Event has already been observered or if it is new and update the models accordingly"""
-    print("DEBUG - group_trigger")
+    logger.debug("group_trigger")
 
     # instance is the new Event
     logger.info("Trying to group with similar events")
@@ -61,7 +68,7 @@ def group_trigger(sender, instance, **kwargs):
         "earliest_event_observed": instance.event_observed,
         "latest_event_observed": instance.event_observed,
     }
-    print(f"DEBUG - instanceData {instanceData}")
+    logger.debug("instanceData %s", instanceData)
 
     if instance.source_name:
         instanceData["source_name"] = instance.source_name
@@ -76,18 +83,16 @@ def group_trigger(sender, instance, **kwargs):
     )[0]
     # Link the Event (have to update this way to prevent save() triggering this function again)
     logger.info(f"Linking event ({instance.id}) to group {event_group}")
-    print(f"Linking event ({instance.id}) to group {event_group}")
 
     Event.objects.filter(id=instance.id).update(event_group_id=event_group)
 
     if instance.ignored:
         # Event ignored so do nothing
-        print(f"DEBUG - Event ignored so do nothing")
         logger.info("Event ignored so do nothing")
         return
 
+    event_coord = None
     if instance.ra and instance.dec:
-        print("DEBUG - Has ra and dec so getting sky coordinates")
         logger.info(f"Getting sky coordinates {instance.ra} {instance.dec}")
         event_coord = SkyCoord(ra=instance.ra * u.degree, dec=instance.dec * u.degree)
 
@@ -106,15 +111,12 @@ def group_trigger(sender, instance, **kwargs):
             logger.info(
                 f"Proposal decision (prop_dec.id, prop_dec.decision): {prop_dec.id, prop_dec.decision}"
             )
-            print(
-                f"Proposal decision (prop_dec.id, prop_dec.decision): {prop_dec.id, prop_dec.decision}"
-            )
             if prop_dec.decision == "C":
                 # Previous observation canceled so assume no new observations should be triggered
                 prop_dec.decision_reason += f"{datetime.datetime.utcnow()}: Event ID {instance.id}: Previous observation canceled so not observing . \n"
                 logger.info('Save proposal decision (prop_dec.decision == "C")')
                 prop_dec.save()
-            elif prop_dec.decision == "I" or prop_dec.decision == "E":
+            elif prop_dec.decision in {"I", "E"}:
                 # Previous events were ignored, check if this new one is up to our standards
                 # Update pos
                 prop_dec.ra = instance.ra
@@ -130,10 +132,21 @@ def group_trigger(sender, instance, **kwargs):
                     prop_dec,
                     instance,
                 )
-            elif prop_dec.decision == "T" or prop_dec.decision == "TT":
+            elif prop_dec.decision in {"T", "TT"}:
                 # Check new event position is further away than the repointing limit
-                print("DEBUG - testing new pointing")
-                if prop_dec.ra and prop_dec.dec:
+                logger.debug("Testing new pointing")
+                if not (prop_dec.ra and prop_dec.dec):
+                    # No previous position to compare to so check the new event
+                    proposal_worth_observing(
+                        prop_dec,
+                        instance,
+                    )
+                elif event_coord is None:
+                    # Already observing and the new event can't move the pointing
+                    prop_dec.decision_reason = f"{prop_dec.decision_reason}{datetime.datetime.utcnow()}: Event ID {instance.id}: New event has no position so not repointing. \n"
+                    logger.info("New event has no position so not repointing")
+                    prop_dec.save()
+                else:
                     old_event_coord = SkyCoord(
                         ra=prop_dec.ra * u.degree, dec=prop_dec.dec * u.degree
                     )
@@ -170,11 +183,6 @@ def group_trigger(sender, instance, **kwargs):
 
                         # send off alert messages to users and admins
                         send_all_alerts(True, debug_bool, False, prop_dec)
-                else:
-                    proposal_worth_observing(
-                        prop_dec,
-                        instance,
-                    )
         if (
             instance.pos_error
             and instance.pos_error < event_group.pos_error
@@ -197,7 +205,7 @@ def group_trigger(sender, instance, **kwargs):
         logger.info("First unignored event so create proposal decisions objects")
         # Loop over settings
         proposal_settings = ProposalSettings.objects.all().order_by("priority")
-        print(vars(instance))
+        logger.debug("instance: %s", vars(instance))
 
         # print(instance)
 
@@ -238,8 +246,9 @@ def proposal_worth_observing(
     observation_reason : `str`, optional
         The reason for this observation. The default is "First Observation" but other potential reasons are "Repointing".
     """
-    print("DEBUG - proposal_worth_observing")
-    logger.info(f"Checking that proposal {prop_dec.proposal} is worth observing.")
+    proposal = prop_dec.proposal
+    event_id = voevent.id
+    logger.info(f"Checking that proposal {proposal} is worth observing.")
     # Defaults if not worth observing
     trigger_bool = debug_bool = pending_bool = False
     decision_reason_log = prop_dec.decision_reason
@@ -249,19 +258,18 @@ def proposal_worth_observing(
     both = TRIGGER_ON[1][0]
     real_only = TRIGGER_ON[2][0]
 
-    print(prop_dec.proposal.testing)
-    print(voevent.role)
+    logger.debug("proposal testing: %s, event role: %s", proposal.testing, voevent.role)
 
     if (
-        prop_dec.proposal.testing == pretend_real
+        proposal.testing == pretend_real
         and voevent.role == "test"
-        or prop_dec.proposal.testing == real_only
+        or proposal.testing == real_only
         and voevent.role == "test"
     ):
         decision = "I"
         decision_reason_log = (
             decision_reason_log
-            + f"Proposal setting {prop_dec.proposal.testing} does not trigger on event role {voevent.role}"
+            + f"Proposal setting {proposal.testing} does not trigger on event role {voevent.role}"
         )
         # Update proposal decision and log
         prop_dec.decision = decision
@@ -271,19 +279,19 @@ def proposal_worth_observing(
 
     # Continue to next test
     if (
-        prop_dec.proposal.event_telescope is None
-        or str(prop_dec.proposal.event_telescope).strip() == voevent.telescope.strip()
+        proposal.event_telescope is None
+        or str(proposal.event_telescope).strip() == voevent.telescope.strip()
     ):
         # This project observes events from this telescope
         # Check if this proposal thinks this event is worth observing
         if (
-            prop_dec.proposal.source_type == "GRB"
+            proposal.source_type == "GRB"
             and prop_dec.event_group_id.source_type == "GRB"
         ):
-            print("DEBUG - prop_dec.source_type is GRB")
             # This proposal wants to observe GRBs so check if it is worth observing
-            print(
-                f"DEBUG - maximum_position_uncertainty: {prop_dec.proposal.maximum_position_uncertainty}"
+            logger.debug(
+                "prop_dec.source_type is GRB, maximum_position_uncertainty: %s",
+                proposal.maximum_position_uncertainty,
             )
 
             (
@@ -301,40 +309,38 @@ def proposal_worth_observing(
                 pos_error=voevent.pos_error,
                 dec=prop_dec.dec,
                 # Thresholds
-                event_any_duration=prop_dec.proposal.event_any_duration,
-                event_min_duration=prop_dec.proposal.event_min_duration,
-                event_max_duration=prop_dec.proposal.event_max_duration,
-                pending_min_duration_1=prop_dec.proposal.pending_min_duration_1,
-                pending_max_duration_1=prop_dec.proposal.pending_max_duration_1,
-                pending_min_duration_2=prop_dec.proposal.pending_min_duration_2,
-                pending_max_duration_2=prop_dec.proposal.pending_max_duration_2,
-                fermi_min_detection_prob=prop_dec.proposal.fermi_prob,
-                swift_min_rate_signif=prop_dec.proposal.swift_rate_signf,
-                minimum_hess_significance=prop_dec.proposal.minimum_hess_significance,
-                maximum_hess_significance=prop_dec.proposal.maximum_hess_significance,
-                maximum_position_uncertainty=prop_dec.proposal.maximum_position_uncertainty,
-                atca_dec_min_1=prop_dec.proposal.atca_dec_min_1,
-                atca_dec_max_1=prop_dec.proposal.atca_dec_max_1,
-                atca_dec_min_2=prop_dec.proposal.atca_dec_min_2,
-                atca_dec_max_2=prop_dec.proposal.atca_dec_max_2,
+                event_any_duration=proposal.event_any_duration,
+                event_min_duration=proposal.event_min_duration,
+                event_max_duration=proposal.event_max_duration,
+                pending_min_duration_1=proposal.pending_min_duration_1,
+                pending_max_duration_1=proposal.pending_max_duration_1,
+                pending_min_duration_2=proposal.pending_min_duration_2,
+                pending_max_duration_2=proposal.pending_max_duration_2,
+                fermi_min_detection_prob=proposal.fermi_prob,
+                swift_min_rate_signif=proposal.swift_rate_signf,
+                minimum_hess_significance=proposal.minimum_hess_significance,
+                maximum_hess_significance=proposal.maximum_hess_significance,
+                maximum_position_uncertainty=proposal.maximum_position_uncertainty,
+                atca_dec_min_1=proposal.atca_dec_min_1,
+                atca_dec_max_1=proposal.atca_dec_max_1,
+                atca_dec_min_2=proposal.atca_dec_min_2,
+                atca_dec_max_2=proposal.atca_dec_max_2,
                 # Other
-                proposal_telescope_id=prop_dec.proposal.telescope_id,
+                proposal_telescope_id=proposal.telescope_id,
                 decision_reason_log=decision_reason_log,
-                event_id=voevent.id,
+                event_id=event_id,
             )
             proj_source_bool = True
 
         elif (
-            prop_dec.proposal.source_type == "FS"
-            and prop_dec.event_group_id.source_type == "FS"
+            proposal.source_type == "FS" and prop_dec.event_group_id.source_type == "FS"
         ):
             # This proposal wants to observe FSs and there is no FS logic so observe
             trigger_bool = True
-            decision_reason_log = f"{decision_reason_log}{datetime.datetime.utcnow()}: Event ID {voevent.id}: Triggering on Flare Star {prop_dec.event_group_id.source_name}. \n"
+            decision_reason_log = f"{decision_reason_log}{datetime.datetime.utcnow()}: Event ID {event_id}: Triggering on Flare Star {prop_dec.event_group_id.source_name}. \n"
             proj_source_bool = True
         elif (
-            prop_dec.proposal.source_type == "NU"
-            and prop_dec.event_group_id.source_type == "NU"
+            proposal.source_type == "NU" and prop_dec.event_group_id.source_type == "NU"
         ):
             # This proposal wants to observe GRBs so check if it is worth observing
             (
@@ -347,18 +353,17 @@ def proposal_worth_observing(
                 antares_ranking=voevent.antares_ranking,
                 telescope=voevent.telescope,
                 # Thresholds
-                antares_min_ranking=prop_dec.proposal.antares_min_ranking,
+                antares_min_ranking=proposal.antares_min_ranking,
                 # Other
                 decision_reason_log=decision_reason_log,
-                event_id=voevent.id,
+                event_id=event_id,
             )
             proj_source_bool = True
 
         elif (
-            prop_dec.proposal.source_type == "GW"
-            and prop_dec.event_group_id.source_type == "GW"
+            proposal.source_type == "GW" and prop_dec.event_group_id.source_type == "GW"
         ):
-            print("DEBUG - prop_dec.source_type is GW")
+            logger.debug("prop_dec.source_type is GW")
 
             # print(vars(voevent))
 
@@ -378,22 +383,22 @@ def proposal_worth_observing(
                 lvc_instruments=voevent.lvc_instruments,
                 telescope=voevent.telescope,
                 # Thresholds
-                minimum_neutron_star_probability=prop_dec.proposal.minimum_neutron_star_probability,
-                maximum_neutron_star_probability=prop_dec.proposal.maximum_neutron_star_probability,
-                minimum_binary_neutron_star_probability=prop_dec.proposal.minimum_binary_neutron_star_probability,
-                maximum_binary_neutron_star_probability=prop_dec.proposal.maximum_binary_neutron_star_probability,
-                minimum_neutron_star_black_hole_probability=prop_dec.proposal.minimum_neutron_star_black_hole_probability,
-                maximum_neutron_star_black_hole_probability=prop_dec.proposal.maximum_neutron_star_black_hole_probability,
-                minimum_binary_black_hole_probability=prop_dec.proposal.minimum_binary_black_hole_probability,
-                maximum_binary_black_hole_probability=prop_dec.proposal.maximum_binary_black_hole_probability,
-                minimum_terrestial_probability=prop_dec.proposal.minimum_terrestial_probability,
-                maximum_terrestial_probability=prop_dec.proposal.maximum_terrestial_probability,
-                observe_significant=prop_dec.proposal.observe_significant,
-                maximum_false_alarm_rate=prop_dec.proposal.maximum_false_alarm_rate,
+                minimum_neutron_star_probability=proposal.minimum_neutron_star_probability,
+                maximum_neutron_star_probability=proposal.maximum_neutron_star_probability,
+                minimum_binary_neutron_star_probability=proposal.minimum_binary_neutron_star_probability,
+                maximum_binary_neutron_star_probability=proposal.maximum_binary_neutron_star_probability,
+                minimum_neutron_star_black_hole_probability=proposal.minimum_neutron_star_black_hole_probability,
+                maximum_neutron_star_black_hole_probability=proposal.maximum_neutron_star_black_hole_probability,
+                minimum_binary_black_hole_probability=proposal.minimum_binary_black_hole_probability,
+                maximum_binary_black_hole_probability=proposal.maximum_binary_black_hole_probability,
+                minimum_terrestial_probability=proposal.minimum_terrestial_probability,
+                maximum_terrestial_probability=proposal.maximum_terrestial_probability,
+                observe_significant=proposal.observe_significant,
+                maximum_false_alarm_rate=proposal.maximum_false_alarm_rate,
                 # Other
                 event_observed=voevent.event_observed,
                 decision_reason_log=decision_reason_log,
-                event_id=voevent.id,
+                event_id=event_id,
                 event_type=voevent.event_type,
             )
             proj_source_bool = True
@@ -401,29 +406,30 @@ def proposal_worth_observing(
 
         if not proj_source_bool:
             # Proposal does not observe this type of source so update message
-            decision_reason_log = f"{decision_reason_log}{datetime.datetime.utcnow()}: Event ID {voevent.id}: This proposal does not observe {prop_dec.event_group_id.source_type}s. \n"
+            decision_reason_log = f"{decision_reason_log}{datetime.datetime.utcnow()}: Event ID {event_id}: This proposal does not observe {prop_dec.event_group_id.source_type}s. \n"
     else:
         # Proposal does not observe event from this telescope so update message
-        decision_reason_log = f"{decision_reason_log}{datetime.datetime.utcnow()}: Event ID {voevent.id}: This proposal does not trigger on events from {voevent.telescope}. \n"
-    print(trigger_bool, debug_bool, pending_bool, decision_reason_log)
+        decision_reason_log = f"{decision_reason_log}{datetime.datetime.utcnow()}: Event ID {event_id}: This proposal does not trigger on events from {voevent.telescope}. \n"
+    logger.debug(
+        "trigger_bool: %s, debug_bool: %s, pending_bool: %s",
+        trigger_bool,
+        debug_bool,
+        pending_bool,
+    )
     if trigger_bool:
         # Check if you can observe and if so send off the observation
         logger.info("Check if you can observe and if so send off the observation")
-        print("DEBUG - Trigger observation")
         try:
             decision, decision_reason_log = trigger_observation(
                 prop_dec,
                 decision_reason_log,
                 reason=observation_reason,
-                event_id=voevent.id,
+                event_id=event_id,
             )
-            print(decision, decision_reason_log)
         except Exception as e:
-            print(e)
             logger.info(e)
             decision = "E"
-        print("DEBUG - trigger_observation result")
-        print(decision, decision_reason_log)
+        logger.debug("trigger_observation result: %s", decision)
         if decision == "E":
             # Error observing so send off debug
             debug_bool = True
@@ -444,7 +450,6 @@ def proposal_worth_observing(
 
     # send off alert messages to users and admins
     logger.info("Sending alerts to users and admins")
-    print(f"\nDEBUG - {trigger_bool} {debug_bool} {pending_bool} {prop_dec}\n")
     send_all_alerts(trigger_bool, debug_bool, pending_bool, prop_dec)
 
 
@@ -465,11 +470,7 @@ def send_all_alerts(trigger_bool, debug_bool, pending_bool, proposal_decision_mo
 
     # Work out when the source will go below the horizon
     telescope = proposal_decision_model.proposal.telescope
-    location = EarthLocation(
-        lon=telescope.lon * u.deg,
-        lat=telescope.lat * u.deg,
-        height=telescope.height * u.m,
-    )
+    location = get_earth_location(telescope.lon, telescope.lat, telescope.height)
     if proposal_decision_model.ra and proposal_decision_model.dec:
         obs_source = SkyCoord(
             proposal_decision_model.ra,
@@ -574,9 +575,6 @@ def send_alert_type(
     telescopes,
     set_time_utc,
 ):
-    # Set up twillo client for SMS and calls
-    client = Client(account_sid, auth_token)
-
     # Set up message text
     message_text = f"""{message_type_text}
 
@@ -611,7 +609,7 @@ https://mwa-trigger.duckdns.org/proposal_decision_details/{proposal_decision_mod
     elif alert_type == 1:
         # Send an SMS
         logger.info("Send an SMS")
-        message = client.messages.create(
+        message = get_twilio_client().messages.create(
             to=address,
             from_=my_number,
             body=message_text,
@@ -619,7 +617,7 @@ https://mwa-trigger.duckdns.org/proposal_decision_details/{proposal_decision_mod
     elif alert_type == 2:
         # Make a call
         logger.info("Make a call")
-        call = client.calls.create(
+        call = get_twilio_client().calls.create(
             url="http://demo.twilio.com/docs/voice.xml",
             to=address,
             from_=my_number,
@@ -1,15 +1,20 @@
 from math import floor
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import io
 import astropy.units as u
+import numpy as np
 from astropy.coordinates import SkyCoord, EarthLocation, AltAz
 from astropy.time import Time
 from datetime import timedelta, datetime, timezone
 
-import random
+import threading
+import time as pytime
+import uuid
 import urllib.request
 from trigger_app.utils import (
     getMWAPointingsFromSkymapFile,
     getMWARaDecFromAltAz,
-    isClosePosition,
     subArrayMWAPointings,
 )
 from astropy.table import Table
@@ -24,15 +29,245 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# The proposal testing options (see models.TRIGGER_ON)
+TRIGGER_REAL_PRETEND = TRIGGER_ON[0][0]
+TRIGGER_BOTH = TRIGGER_ON[1][0]
+TRIGGER_REAL = TRIGGER_ON[2][0]
+
+# Used to process skymaps in the background while requests are sent to the telescope
+skymap_executor = ThreadPoolExecutor(max_workers=2)
+
+# Horizon altitudes of recent events, see get_horizon_altitudes
+HORIZON_CACHE_TTL = 2.0
+horizon_cache = {}
+horizon_cache_lock = threading.Lock()
+
+# New skymap pointings within this many degrees of the current sub arrays don't repoint
+REPOINT_LIMIT_DEG = 10
+
+
+def next_fallback_trigger_id():
+    """Get a unique trigger ID for observations the telescope didn't give one.
+
+    Random UUIDs are used so IDs from different worker processes and previous runs don't
+    collide on the Observations primary key.
+    """
+    return uuid.uuid4().hex
+
 
 def round_to_nearest_modulo_8(number):
-    """Rounds a number to the nearest modulo of 8."""
-    remainder = number % 8
-    if remainder >= 4:
-        rounded_number = number + (8 - remainder)
-    else:
-        rounded_number = number - remainder
-    return rounded_number
+    """Rounds a non-negative number to the nearest modulo of 8 (halves round up)."""
+    return (int(number) + 4) & ~7
+
+
+@lru_cache(maxsize=16)
+def get_earth_location(lon, lat, height):
+    """Create the EarthLocation of a telescope, cached so it is only built once per site.
+
+    Parameters
+    ----------
+    lon : `float`
+        The longitude of the telescope in degrees.
+    lat : `float`
+        The latitude of the telescope in degrees.
+    height : `float`
+        The height of the telescope in metres.
+
+    Returns
+    -------
+    location : `astropy.coordinates.EarthLocation`
+        The location of the telescope.
+    """
+    return EarthLocation(lon=lon * u.deg, lat=lat * u.deg, height=height * u.m)
+
+
+def get_horizon_altitudes(telescope, ra, dec, exptime):
+    """Work out the altitude of a source at the start and end of an observation.
+
+    Events from the same trigger tend to arrive seconds apart, so the altitudes are
+    cached for HORIZON_CACHE_TTL seconds per telescope, position and exposure time.
+
+    Parameters
+    ----------
+    telescope : `django.db.models.Model`
+        The Django Telescope model object with the lon, lat and height of the telescope.
+    ra : `float`
+        The RA of the source in degrees.
+    dec : `float`
+        The Dec of the source in degrees.
+    exptime : `int`
+        The exposure time of the observation in seconds.
+
+    Returns
+    -------
+    alt_beg : `float`
+        The altitude of the source at the start of the observation in degrees.
+    alt_end : `float`
+        The altitude of the source at the end of the observation in degrees.
+    """
+    key = (
+        telescope.lon,
+        telescope.lat,
+        telescope.height,
+        round(ra, 3),
+        round(dec, 3),
+        exptime,
+    )
+    now = pytime.monotonic()
+    with horizon_cache_lock:
+        cached = horizon_cache.get(key)
+    if cached is not None and now - cached[0] < HORIZON_CACHE_TTL:
+        return cached[1]
+
+    location = get_earth_location(telescope.lon, telescope.lat, telescope.height)
+    obs_source = SkyCoord(ra, dec, unit=(u.deg, u.deg))
+    # Convert from RA/Dec to Alt/Az at the start and end of the obs in one transform
+    obstimes = Time.now() + [0, exptime] * u.s
+    obs_source_altaz = obs_source.transform_to(
+        AltAz(obstime=obstimes, location=location)
+    )
+    alt_beg, alt_end = obs_source_altaz.alt.deg
+
+    # Drop expired entries so the cache only holds the current burst of events. The
+    # lock stops other threads changing the cache while it is pruned
+    with horizon_cache_lock:
+        for old_key in [
+            k for k, v in horizon_cache.items() if now - v[0] >= HORIZON_CACHE_TTL
+        ]:
+            del horizon_cache[old_key]
+        horizon_cache[key] = (now, (alt_beg, alt_end))
+    return alt_beg, alt_end
+
+
+@lru_cache(maxsize=32)
+def get_skymap_pointings(skymap_fits):
+    """Download a skymap and work out the best MWA sub array pointings for it.
+
+    The results are cached by URL so the same skymap is only downloaded and parsed once
+    per process, even when several events or proposals reference it.
+    Use get_skymap_pointings.cache_clear() to drop the cache.
+
+    Parameters
+    ----------
+    skymap_fits : `str`
+        The URL of the multi-order skymap FITS file.
+
+    Returns
+    -------
+    skymap : `astropy.table.Table`
+        The skymap table.
+    time : `astropy.time.Time`
+        The time used to convert the MWA pointings to RA/Dec.
+    pointings : `list`
+        The (up to) four most probable MWA pointings, see getMWAPointingsFromSkymapFile.
+    """
+    event_filename = download_file(skymap_fits, cache=True)
+    skymap = Table.read(event_filename)
+    return getMWAPointingsFromSkymapFile(skymap)
+
+
+def get_default_sub_arrays(proposal_settings, time=None):
+    """Work out the RA/Dec of the proposal's default MWA sub array pointings.
+
+    All four sub array Alt/Az positions are converted in a single coordinate transform.
+
+    Parameters
+    ----------
+    proposal_settings : `django.db.models.Model`
+        The Django ProposalSettings model object with the mwa_sub_alt_* and mwa_sub_az_* settings.
+    time : `astropy.time.Time`, optional
+        The time of the pointings. Default: Time.now().
+
+    Returns
+    -------
+    mwa_sub_arrays : `dict`
+        The "ra" and "dec" lists (in degrees) of the NE, NW, SE and SW sub arrays.
+    """
+    if time is None:
+        time = Time.now()
+    ra, dec, _ = getMWARaDecFromAltAz(
+        alt=[
+            proposal_settings.mwa_sub_alt_NE,
+            proposal_settings.mwa_sub_alt_NW,
+            proposal_settings.mwa_sub_alt_SE,
+            proposal_settings.mwa_sub_alt_SW,
+        ],
+        az=[
+            proposal_settings.mwa_sub_az_NE,
+            proposal_settings.mwa_sub_az_NW,
+            proposal_settings.mwa_sub_az_SE,
+            proposal_settings.mwa_sub_az_SW,
+        ],
+        time=time,
+    )
+    return {"dec": dec.value.tolist(), "ra": ra.value.tolist()}
+
+
+def get_skymap_sub_arrays(pointings):
+    """Get the RA/Dec of the MWA sub arrays from the skymap pointings.
+
+    Parameters
+    ----------
+    pointings : `list`
+        The MWA pointings from getMWAPointingsFromSkymapFile.
+
+    Returns
+    -------
+    mwa_sub_arrays : `dict`
+        The "ra" and "dec" lists (in degrees) of the first four pointings.
+
+    Raises
+    ------
+    ValueError
+        If there are fewer than four pointings, one for each sub array.
+    """
+    if len(pointings) < 4:
+        raise ValueError(
+            f"The skymap only has {len(pointings)} pointings but the four MWA sub arrays need four."
+        )
+    ra = u.Quantity([pointing[3] for pointing in pointings[:4]]).to_value(u.deg)
+    dec = u.Quantity([pointing[4] for pointing in pointings[:4]]).to_value(u.deg)
+    return {"dec": dec.tolist(), "ra": ra.tolist()}
+
+
+def should_repoint(
+    current_arrays_ra, current_arrays_dec, pointings, deg=REPOINT_LIMIT_DEG
+):
+    """Decide if the MWA sub arrays should be repointed to a new set of skymap pointings.
+
+    The angular separations between every current sub array and every new pointing are
+    calculated in a single vectorised call.
+
+    Parameters
+    ----------
+    current_arrays_ra, current_arrays_dec : `list`
+        The RA and Dec (in degrees) of the current sub array pointings.
+    pointings : `list`
+        The new pointings from getMWAPointingsFromSkymapFile where the 4th and 5th elements are the RA and Dec.
+    deg : `float`, optional
+        Pointings within this many degrees of each other are considered the same position. Default: REPOINT_LIMIT_DEG.
+
+    Returns
+    -------
+    repoint : `boolean`
+        True if none of the new pointings are close to any of the current sub arrays.
+        False if there are no current sub array pointings to compare with.
+    """
+    if len(current_arrays_ra) == 0 or len(current_arrays_dec) == 0:
+        # Nothing to compare with so keep the current observation
+        return False
+    current_coords = SkyCoord(
+        ra=current_arrays_ra * u.deg, dec=current_arrays_dec * u.deg, frame="icrs"
+    )
+    pointing_coords = SkyCoord(
+        ra=[pointing[3].to_value(u.deg) for pointing in pointings] * u.deg,
+        dec=[pointing[4].to_value(u.deg) for pointing in pointings] * u.deg,
+        frame="icrs",
+    )
+    angular_sep = current_coords[:, np.newaxis].separation(
+        pointing_coords[np.newaxis, :]
+    )
+    return not np.any(angular_sep < deg * u.deg)
 
 
 def dump_mwa_buffer():
@@ -65,505 +300,337 @@ def trigger_observation(
     decision_reason_log : `str`
         The updated trigger message to include an observation specific logs.
     """
-    print("Trigger observation")
-    trigger_real_pretend = TRIGGER_ON[0][0]
-    trigger_both = TRIGGER_ON[1][0]
-    trigger_real = TRIGGER_ON[2][0]
-    voevents = Event.objects.filter(trig_id=proposal_decision_model.trig_id).order_by(
-        "-recieved_data"
-    )
-    telescopes = []
+    logger.debug("Trigger observation")
+    proposal = proposal_decision_model.proposal
+    telescope_name = proposal.telescope.name
+    is_mwa = telescope_name.startswith("MWA")
+    trig_id = proposal_decision_model.trig_id
+    # Load the events once so indexing, counting and iterating don't query again
+    voevents = list(Event.objects.filter(trig_id=trig_id).order_by("-recieved_data"))
     latestVoevent = voevents[0]
+    latest_event_type = latestVoevent.event_type
+    latest_skymap_fits = latestVoevent.lvc_skymap_fits
+    # Accumulate the log in a buffer rather than re-copying the string on every append
+    reason_log = io.StringIO()
+    # Timestamp for the log entries, only updated after requests to the telescope
+    now = datetime.utcnow()
+    reason_log.write(decision_reason_log)
     # Check if source is above the horizon for MWA
-    if (
-        proposal_decision_model.proposal.telescope.name.startswith("MWA")
-        and proposal_decision_model.ra
-        and proposal_decision_model.dec
-    ):
-        print("Checking if is above the horizon for MWA")
-        # Create Earth location for the telescope
-        telescope = proposal_decision_model.proposal.telescope
-        location = EarthLocation(
-            lon=telescope.lon * u.deg,
-            lat=telescope.lat * u.deg,
-            height=telescope.height * u.m,
-        )
-        print("obtained earth location")
-
-        obs_source = SkyCoord(
+    if is_mwa and proposal_decision_model.ra and proposal_decision_model.dec:
+        logger.debug("Checking if is above the horizon for MWA")
+        alt_beg, alt_end = get_horizon_altitudes(
+            proposal.telescope,
             proposal_decision_model.ra,
             proposal_decision_model.dec,
-            # equinox='J2000',
-            unit=(u.deg, u.deg),
-        )
-        print("obtained obs source location")
-        # Convert from RA/Dec to Alt/Az
-        obs_source_altaz_beg = obs_source.transform_to(
-            AltAz(obstime=Time.now(), location=location)
-        )
-        alt_beg = obs_source_altaz_beg.alt.deg
-        # Calculate alt at end of obs
-        end_time = Time.now() + timedelta(
-            seconds=proposal_decision_model.proposal.mwa_exptime
+            proposal.mwa_exptime,
         )
-        obs_source_altaz_end = obs_source.transform_to(
-            AltAz(obstime=end_time, location=location)
-        )
-        alt_end = obs_source_altaz_end.alt.deg
-
-        print("converted obs for horizon")
 
         if (
-            alt_beg < proposal_decision_model.proposal.mwa_horizon_limit
-            and alt_end < proposal_decision_model.proposal.mwa_horizon_limit
+            alt_beg < proposal.mwa_horizon_limit
+            and alt_end < proposal.mwa_horizon_limit
         ):
-            horizon_message = f"{datetime.utcnow()}: Event ID {event_id}: Not triggering due to horizon limit: alt_beg {alt_beg:.4f} < {proposal_decision_model.proposal.mwa_horizon_limit:.4f} and alt_end {alt_end:.4f} < {proposal_decision_model.proposal.mwa_horizon_limit:.4f}. "
+            horizon_message = f"{now}: Event ID {event_id}: Not triggering due to horizon limit: alt_beg {alt_beg:.4f} < {proposal.mwa_horizon_limit:.4f} and alt_end {alt_end:.4f} < {proposal.mwa_horizon_limit:.4f}. "
             logger.debug(horizon_message)
-            return "I", decision_reason_log + horizon_message
+            reason_log.write(horizon_message)
+            return "I", reason_log.getvalue()
 
-        elif alt_beg < proposal_decision_model.proposal.mwa_horizon_limit:
+        elif alt_beg < proposal.mwa_horizon_limit:
             # Warn them in the log
-            decision_reason_log += f"{datetime.utcnow()}: Event ID {event_id}: Warning: The source is below the horizion limit at the start of the observation alt_beg {alt_beg:.4f}. \n"
+            reason_log.write(
+                f"{now}: Event ID {event_id}: Warning: The source is below the horizion limit at the start of the observation alt_beg {alt_beg:.4f}. \n"
+            )
 
-        elif alt_end < proposal_decision_model.proposal.mwa_horizon_limit:
+        elif alt_end < proposal.mwa_horizon_limit:
             # Warn them in the log
-            decision_reason_log += f"{datetime.utcnow()}: Event ID {event_id}: Warning: The source will set below the horizion limit by the end of the observation alt_end {alt_end:.4f}. \n"
+            reason_log.write(
+                f"{now}: Event ID {event_id}: Warning: The source will set below the horizion limit by the end of the observation alt_end {alt_end:.4f}. \n"
+            )
 
         # above the horizon so send off telescope specific set ups
-        decision_reason_log += f"{datetime.utcnow()}: Event ID {event_id}: Above horizon so attempting to observe with {proposal_decision_model.proposal.telescope.name}. \n"
+        reason_log.write(
+            f"{now}: Event ID {event_id}: Above horizon so attempting to observe with {telescope_name}. \n"
+        )
 
         logger.debug(
-            f"Triggered observation at an elevation of {alt_beg} to elevation of {alt_end}"
+            "Triggered observation at an elevation of %s to elevation of %s",
+            alt_beg,
+            alt_end,
         )
 
     mwa_sub_arrays = None
 
-    if proposal_decision_model.proposal.telescope.name.startswith("MWA"):
+    if is_mwa:
 
         # If telescope ends in VCS then this proposal is for observing in VCS mode
-        vcsmode = proposal_decision_model.proposal.telescope.name.endswith("VCS")
+        vcsmode = telescope_name.endswith("VCS")
         if vcsmode:
-            print("VCS Mode")
+            logger.debug("VCS Mode")
 
         # Create an observation name
         # Collect event telescopes
 
-        print(proposal_decision_model.trig_id)
-
-        for voevent in voevents:
-            telescopes.append(voevent.telescope)
-        # Make sure they are unique and seperate with a _
-        telescopes = "_".join(list(set(telescopes)))
-        obsname = f"{telescopes}_{proposal_decision_model.trig_id}"
+        # Make sure they are unique (keeping their order) and seperate with a _
+        telescopes = "_".join(dict.fromkeys(voevent.telescope for voevent in voevents))
+        obsname = f"{telescopes}_{trig_id}"
 
         buffered = False
 
         pretend = True
         repoint = None
 
-        print(
-            f"proposal_decision_model.proposal.testing {proposal_decision_model.proposal.testing}"
-        )
-        print(f"latestVoevent {latestVoevent.__dict__}")
-        if (
-            latestVoevent.role == "test"
-            and proposal_decision_model.proposal.testing != trigger_both
-        ):
+        logger.debug("proposal.testing %s", proposal.testing)
+        logger.debug("latestVoevent %s", latestVoevent.__dict__)
+        if latestVoevent.role == "test" and proposal.testing != TRIGGER_BOTH:
             raise Exception("Invalid event observation and proposal setting")
 
-        if (
-            proposal_decision_model.proposal.testing == trigger_both
-            and latestVoevent.role != "test"
-        ):
+        if proposal.testing == TRIGGER_BOTH and latestVoevent.role != "test":
             pretend = False
-        if (
-            proposal_decision_model.proposal.testing == trigger_real
-            and latestVoevent.role != "test"
-        ):
+        if proposal.testing == TRIGGER_REAL and latestVoevent.role != "test":
             pretend = False
-        print(f"pretend: {pretend}")
+        logger.debug("pretend: %s", pretend)
 
-        if proposal_decision_model.proposal.source_type == "GW":
+        if proposal.source_type == "GW":
 
             # Buffer dump if first event, use default array if early warning, process skymap if not early warning
-            if len(voevents) == 1:
+            n_voevents = len(voevents)
+            if n_voevents == 1:
+                # Early warnings use the default sub arrays, otherwise use the skymap if there is one
+                use_skymap = (
+                    latest_skymap_fits is not None
+                    and latest_event_type != "EarlyWarning"
+                )
+                if use_skymap:
+                    # Download and process the skymap while the buffer dump request is sent
+                    skymap_future = skymap_executor.submit(
+                        get_skymap_pointings, latest_skymap_fits
+                    )
+
                 # Dump out the last ~3 mins of MWA buffer to try and catch event
-                print(f"DEBUG - DISABLED dumping MWA buffer")
-                reason = f"{latestVoevent.trig_id} - First event so sending dump MWA buffer request to MWA"
-                decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: First event so sending dump MWA buffer request to MWA\n"
+                logger.debug("Dumping MWA buffer")
+                reason = (
+                    f"{trig_id} - First event so sending dump MWA buffer request to MWA"
+                )
+                reason_log.write(
+                    f"{now}: Event ID {event_id}: First event so sending dump MWA buffer request to MWA\n"
+                )
 
                 buffered = True
-                request_sent_at = datetime.utcnow()
                 (
                     decision_buffer,
-                    decision_reason_log_buffer,
                     obsids_buffer,
                     result_buffer,
-                ) = trigger_mwa_observation(
+                ) = trigger_and_save_mwa_observation(
                     proposal_decision_model,
-                    decision_reason_log,
-                    obsname=obsname,
+                    reason_log,
+                    obsname,
+                    latestVoevent,
+                    "This is a buffer observation ID",
                     vcsmode=vcsmode,
                     event_id=event_id,
                     mwa_sub_arrays=mwa_sub_arrays,
                     buffered=buffered,
                     pretend=pretend,
+                    save_message="Saving buffer observation result.",
                 )
-                print(f"obsids_buffer: {obsids_buffer}")
-                decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Saving buffer observation result. \n"
-                if decision_buffer.find("T") > -1:
-                    saved_obs_1 = Observations.objects.create(
-                        trigger_id=result_buffer["trigger_id"]
-                        or random.randrange(10000, 99999),
-                        telescope=proposal_decision_model.proposal.telescope,
-                        proposal_decision_id=proposal_decision_model,
-                        reason=f"This is a buffer observation ID",
-                        website_link=f"http://ws.mwatelescope.org/observation/obs/?obsid={obsids_buffer[0]}",
-                        mwa_sub_arrays=mwa_sub_arrays,
-                        event=latestVoevent,
-                        mwa_response=result_buffer,
-                        request_sent_at=request_sent_at,
-                    )
+                now = datetime.utcnow()
 
                 # Handle the unique case of the early warning
-                if latestVoevent.event_type == "EarlyWarning":
-                    ps = proposal_decision_model.proposal
-                    reason = f"{latestVoevent.trig_id} - First event is an Early Warning so ignoring skymap"
+                if latest_event_type == "EarlyWarning":
+                    reason = f"{trig_id} - First event is an Early Warning so ignoring skymap"
 
-                    print(f"DEBUG - ps {ps.__dict__}")
+                    logger.debug("proposal %s", proposal.__dict__)
 
-                    sub1 = getMWARaDecFromAltAz(
-                        alt=ps.mwa_sub_alt_NE, az=ps.mwa_sub_az_NE, time=Time.now()
-                    )
-                    sub2 = getMWARaDecFromAltAz(
-                        alt=ps.mwa_sub_alt_NW, az=ps.mwa_sub_az_NW, time=Time.now()
-                    )
-                    sub3 = getMWARaDecFromAltAz(
-                        alt=ps.mwa_sub_alt_SE, az=ps.mwa_sub_az_SE, time=Time.now()
-                    )
-                    sub4 = getMWARaDecFromAltAz(
-                        alt=ps.mwa_sub_alt_SW, az=ps.mwa_sub_az_SW, time=Time.now()
-                    )
+                    mwa_sub_arrays = get_default_sub_arrays(proposal)
 
-                    print(f"DEBUG - sub1[1].value 2 { sub1[1].value }")
-
-                    mwa_sub_arrays = {
-                        "dec": [
-                            sub1[1].value,
-                            sub2[1].value,
-                            sub3[1].value,
-                            sub4[1].value,
-                        ],
-                        "ra": [
-                            sub1[0].value,
-                            sub2[0].value,
-                            sub3[0].value,
-                            sub4[0].value,
-                        ],
-                    }
-
-                    reason = f"{latestVoevent.trig_id} - Event is an early warning so using default sub arrays and early observation time"
+                    reason = f"{trig_id} - Event is an early warning so using default sub arrays and early observation time"
 
                     timeDiff = datetime.now(timezone.utc) - latestVoevent.event_observed
+                    timeDiffSeconds = timeDiff.total_seconds()
 
-                    if (
-                        timeDiff.total_seconds()
-                        < proposal_decision_model.proposal.early_observation_time_seconds
-                    ):
+                    if timeDiffSeconds < proposal.early_observation_time_seconds:
                         estObsTime = round_to_nearest_modulo_8(
-                            proposal_decision_model.proposal.early_observation_time_seconds
-                            - timeDiff.total_seconds()
+                            proposal.early_observation_time_seconds - timeDiffSeconds
+                        )
+                        reason_log.write(
+                            f"{now}: Event ID {event_id}: Event time was {timeDiffSeconds} seconds ago, early observation proposal setting is {proposal.early_observation_time_seconds} seconds so making an observation of {estObsTime} seconds \n"
+                        )
+                        reason_log.write(
+                            f"{now}: Event ID {event_id}: Sending observation request to MWA \n"
                         )
-                        decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Event time was {timeDiff.total_seconds()} seconds ago, early observation proposal setting is {proposal_decision_model.proposal.early_observation_time_seconds} seconds so making an observation of {estObsTime} seconds \n"
-                        decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Sending observation request to MWA \n"
-                        request_sent_at = datetime.utcnow()
                         # Only schedule a 15 min obs
-                        (
-                            decision,
-                            decision_reason_log_obs,
-                            obsids,
-                            result,
-                        ) = trigger_mwa_observation(
+                        (decision, obsids, result,) = trigger_and_save_mwa_observation(
                             proposal_decision_model,
-                            decision_reason_log,
+                            reason_log,
                             obsname,
+                            latestVoevent,
+                            reason,
                             vcsmode=vcsmode,
                             event_id=event_id,
                             mwa_sub_arrays=mwa_sub_arrays,
                             pretend=pretend,
                         )
-                        print(f"result: {result}")
-                        decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Saving observation result. \n"
-                        if decision.find("T") > -1:
-                            saved_obs_2 = Observations.objects.create(
-                                trigger_id=result["trigger_id"]
-                                or random.randrange(10000, 99999),
-                                telescope=proposal_decision_model.proposal.telescope,
-                                proposal_decision_id=proposal_decision_model,
-                                reason=reason,
-                                mwa_sub_arrays=mwa_sub_arrays,
-                                website_link=f"http://ws.mwatelescope.org/observation/obs/?obsid={obsids[0]}",
-                                event=latestVoevent,
-                                mwa_response=result,
-                                request_sent_at=request_sent_at,
-                            )
                 # else:
-                #     decision_reason_log=f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Event time was {timeDiff.total_seconds()} seconds ago, early_observation_time_seconds is {proposal_decision_model.proposal.early_observation_time_seconds} so not making an observation \n"
+                #     decision_reason_log=f"{decision_reason_log}{now}: Event ID {event_id}: Event time was {timeDiff.total_seconds()} seconds ago, early_observation_time_seconds is {proposal.early_observation_time_seconds} so not making an observation \n"
                 ## If first event is not early warning and has a skymap
-                elif (
-                    len(voevents) == 1
-                    and latestVoevent.lvc_skymap_fits != None
-                    and latestVoevent.event_type != "EarlyWarning"
-                ):
-                    reason = f"{latestVoevent.trig_id} - Event contains a skymap"
-                    print(f"DEBUG - skymap_fits_fits: {latestVoevent.lvc_skymap_fits}")
+                elif use_skymap:
+                    reason = f"{trig_id} - Event contains a skymap"
+                    logger.debug("skymap_fits_fits: %s", latest_skymap_fits)
                     try:
-                        event_filename = download_file(
-                            latestVoevent.lvc_skymap_fits, cache=True
-                        )
-                        skymap = Table.read(event_filename)
                         # alt=[ps.mwa_sub_alt_NE, ps.mwa_sub_alt_NW, ps.mwa_sub_alt_SE, ps.mwa_sub_alt_SW],
                         # az=[ps.mwa_sub_az_NE, ps.mwa_sub_az_NW, ps.mwa_sub_az_SE, ps.mwa_sub_az_SW],
-                        (skymap, time, pointings) = getMWAPointingsFromSkymapFile(
-                            skymap
+                        (skymap, time, pointings) = skymap_future.result()
+                        logger.debug("pointings: %s", pointings)
+
+                        mwa_sub_arrays = get_skymap_sub_arrays(pointings)
+                        reason = (
+                            f"{trig_id} - Event has position so using skymap pointings"
                         )
-                        print(pointings)
-
-                        mwa_sub_arrays = {
-                            "dec": [
-                                pointings[0][4].value,
-                                pointings[1][4].value,
-                                pointings[2][4].value,
-                                pointings[3][4].value,
-                            ],
-                            "ra": [
-                                pointings[0][3].value,
-                                pointings[1][3].value,
-                                pointings[2][3].value,
-                                pointings[3][3].value,
-                            ],
-                        }
-                        reason = f"{latestVoevent.trig_id} - Event has position so using skymap pointings"
 
                         timeDiff = (
                             datetime.now(timezone.utc) - latestVoevent.event_observed
                         )
-                        print(f"timediff - {timeDiff}")
-                        print(timeDiff.total_seconds())
-                        print(
-                            proposal_decision_model.proposal.maximum_observation_time_seconds
-                        )
-                        if (
-                            timeDiff.total_seconds()
-                            < proposal_decision_model.proposal.maximum_observation_time_seconds
-                        ):
+                        timeDiffSeconds = timeDiff.total_seconds()
+                        logger.debug("timediff - %s", timeDiff)
+                        if timeDiffSeconds < proposal.maximum_observation_time_seconds:
                             estObsTime = round_to_nearest_modulo_8(
-                                proposal_decision_model.proposal.maximum_observation_time_seconds
-                                - timeDiff.total_seconds()
+                                proposal.maximum_observation_time_seconds
+                                - timeDiffSeconds
+                            )
+                            reason_log.write(
+                                f"{now}: Event ID {event_id}: Event time was {timeDiffSeconds} seconds ago, maximum_observation_time_second is {proposal.maximum_observation_time_seconds} seconds so making an observation of {estObsTime} seconds \n"
                             )
-                            decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Event time was {timeDiff.total_seconds()} seconds ago, maximum_observation_time_second is {proposal_decision_model.proposal.maximum_observation_time_seconds} seconds so making an observation of {estObsTime} seconds \n"
                             # Only schedule a 15 min obs
-                            proposal_decision_model.proposal.mwa_nobs = floor(
-                                estObsTime
-                                / proposal_decision_model.proposal.mwa_exptime
+                            proposal.mwa_nobs = floor(estObsTime / proposal.mwa_exptime)
+                            reason_log.write(
+                                f"{now}: Event ID {event_id}: Sending sub array observation request to MWA\n"
                             )
-                            decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Sending sub array observation request to MWA\n"
-                            request_sent_at = datetime.utcnow()
                             (
                                 decision,
-                                decision_reason_log_obs,
                                 obsids,
                                 result,
-                            ) = trigger_mwa_observation(
+                            ) = trigger_and_save_mwa_observation(
                                 proposal_decision_model,
-                                decision_reason_log,
+                                reason_log,
                                 obsname,
+                                latestVoevent,
+                                reason,
                                 vcsmode=vcsmode,
                                 event_id=event_id,
                                 mwa_sub_arrays=mwa_sub_arrays,
                                 pretend=pretend,
                             )
-                            print(f"result: {result}")
-                            decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Saving observation result. \n"
-                            if decision.find("T") > -1:
-                                saved_obs_2 = Observations.objects.create(
-                                    trigger_id=result["trigger_id"]
-                                    or random.randrange(10000, 99999),
-                                    telescope=proposal_decision_model.proposal.telescope,
-                                    proposal_decision_id=proposal_decision_model,
-                                    reason=reason,
-                                    mwa_sub_arrays=mwa_sub_arrays,
-                                    website_link=f"http://ws.mwatelescope.org/observation/obs/?obsid={obsids[0]}",
-                                    event=latestVoevent,
-                                    mwa_response=result,
-                                    request_sent_at=request_sent_at,
-                                )
                         else:
-                            decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Event time was {timeDiff.total_seconds()} seconds ago, maximum_observation_time_second is {proposal_decision_model.proposal.maximum_observation_time_seconds} so not making an observation \n"
+                            reason_log.write(
+                                f"{now}: Event ID {event_id}: Event time was {timeDiffSeconds} seconds ago, maximum_observation_time_second is {proposal.maximum_observation_time_seconds} so not making an observation \n"
+                            )
 
                     except Exception as e:
-                        print(e)
                         logger.error("Error getting MWA pointings from skymap")
                         logger.error(e)
 
             # Repoint if there is a newer skymap with different positions
-            if len(voevents) > 1 and latestVoevent.lvc_skymap_fits != None:
-                reason = f"{latestVoevent.trig_id} - Event has a skymap"
+            elif n_voevents > 1 and latest_skymap_fits is not None:
+                reason = f"{trig_id} - Event has a skymap"
 
-                print(f"DEBUG - checking to update position")
-                print(
-                    f"DEBUG - proposal_decision_model.__dict__ {proposal_decision_model.__dict__}"
+                logger.debug("checking to update position")
+                logger.debug(
+                    "proposal_decision_model.__dict__ %s",
+                    proposal_decision_model.__dict__,
                 )
 
                 latestObs = (
-                    Observations.objects.filter(
-                        telescope=proposal_decision_model.proposal.telescope
-                    )
+                    Observations.objects.filter(telescope=proposal.telescope)
                     .order_by("-created_at")
                     .first()
                 )
 
-                print(f"DEBUG - latestObs {latestObs}")
+                logger.debug("latestObs %s", latestObs)
 
                 if latestObs.mwa_sub_arrays is not None:
-                    print(f"DEBUG - skymap_fits_fits: {latestVoevent.lvc_skymap_fits}")
-                    decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: New event has skymap \n"
+                    logger.debug("skymap_fits_fits: %s", latest_skymap_fits)
+                    reason_log.write(
+                        f"{now}: Event ID {event_id}: New event has skymap \n"
+                    )
 
                     try:
-                        skymap = Table.read(latestVoevent.lvc_skymap_fits)
-
-                        (skymap, time, pointings) = getMWAPointingsFromSkymapFile(
-                            skymap
+                        (skymap, time, pointings) = get_skymap_pointings(
+                            latest_skymap_fits
                         )
-                        print(pointings)
+                        logger.debug("pointings: %s", pointings)
                         current_arrays_dec = latestObs.mwa_sub_arrays["dec"]
                         current_arrays_ra = latestObs.mwa_sub_arrays["ra"]
 
-                        repoint = False
-
-                        pointings_dec = []
-                        pointings_ra = []
-                        for res in pointings:
-                            pointings_ra.append(res[3])
-                            pointings_dec.append(res[4])
-
-                            repoint = True
-                            for index, val in enumerate(current_arrays_dec):
-                                print(f"index: {index}")
-                                ra1 = current_arrays_ra[index] * u.deg
-                                dec1 = current_arrays_dec[index] * u.deg
-                                ra2 = res[3]
-                                dec2 = res[4]
-
-                                if isClosePosition(ra1, dec1, ra2, dec2):
-                                    repoint = False
-                        print(f"repoint: {repoint}")
-                        print(current_arrays_dec)
-                        print(pointings_dec)
-                        print(current_arrays_ra)
-                        print(pointings_ra)
+                        repoint = should_repoint(
+                            current_arrays_ra, current_arrays_dec, pointings
+                        )
+                        logger.debug("repoint: %s", repoint)
                         if repoint:
-                            decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: New skymap is more than 4 degrees of previous observation pointing. \n"
-                            reason = f"{latestVoevent.trig_id} - Updating observation positions based on event."
-                            mwa_sub_arrays = {
-                                "dec": [
-                                    pointings[0][4].value,
-                                    pointings[1][4].value,
-                                    pointings[2][4].value,
-                                    pointings[3][4].value,
-                                ],
-                                "ra": [
-                                    pointings[0][3].value,
-                                    pointings[1][3].value,
-                                    pointings[2][3].value,
-                                    pointings[3][3].value,
-                                ],
-                            }
-                            decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Sending sub array observation request to MWA\n"
-                            request_sent_at = datetime.utcnow()
+                            reason_log.write(
+                                f"{now}: Event ID {event_id}: New skymap is more than {REPOINT_LIMIT_DEG} degrees of previous observation pointing. \n"
+                            )
+                            reason = f"{trig_id} - Updating observation positions based on event."
+                            mwa_sub_arrays = get_skymap_sub_arrays(pointings)
+                            reason_log.write(
+                                f"{now}: Event ID {event_id}: Sending sub array observation request to MWA\n"
+                            )
                             (
                                 decision,
-                                decision_reason_log_obs,
                                 obsids,
                                 result,
-                            ) = trigger_mwa_observation(
+                            ) = trigger_and_save_mwa_observation(
                                 proposal_decision_model,
-                                decision_reason_log,
+                                reason_log,
                                 obsname,
+                                latestVoevent,
+                                reason,
                                 vcsmode=vcsmode,
                                 event_id=event_id,
                                 mwa_sub_arrays=mwa_sub_arrays,
                                 pretend=pretend,
                             )
-                            print(f"result: {result}")
-                            decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Saving observation result. \n"
-                            request_sent_at = datetime.utcnow()
-                            if decision.find("T") > -1:
-                                saved_obs_2 = Observations.objects.create(
-                                    trigger_id=result["trigger_id"]
-                                    or random.randrange(10000, 99999),
-                                    telescope=proposal_decision_model.proposal.telescope,
-                                    proposal_decision_id=proposal_decision_model,
-                                    reason=reason,
-                                    mwa_sub_arrays=mwa_sub_arrays,
-                                    website_link=f"http://ws.mwatelescope.org/observation/obs/?obsid={obsids[0]}",
-                                    event=latestVoevent,
-                                    mwa_response=result,
-                                    request_sent_at=request_sent_at,
-                                )
                         else:
-                            decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: New skymap is NOT more than 4 degrees of previous observation pointing. \n"
-                            return "T", decision_reason_log
+                            reason_log.write(
+                                f"{now}: Event ID {event_id}: New skymap is NOT more than {REPOINT_LIMIT_DEG} degrees of previous observation pointing. \n"
+                            )
+                            return "T", reason_log.getvalue()
                     except Exception as e:
-                        print(e)
                         logger.error("Error getting MWA pointings from skymap")
                         logger.error(e)
                 else:
-                    print(f"DEBUG - no sub arrays on previous obs")
-                    decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Could not find sub array position on previous observation. \n"
+                    logger.debug("no sub arrays on previous obs")
+                    reason_log.write(
+                        f"{now}: Event ID {event_id}: Could not find sub array position on previous observation. \n"
+                    )
 
         else:
-            print("Not a GW so ignoring GW logic")
-            decision, decision_reason_log_obs, obsids, result = trigger_mwa_observation(
+            logger.debug("Not a GW so ignoring GW logic")
+            (decision, obsids, result,) = trigger_and_save_mwa_observation(
                 proposal_decision_model,
-                decision_reason_log,
+                reason_log,
                 obsname,
+                latestVoevent,
+                reason,
                 vcsmode=vcsmode,
                 event_id=event_id,
                 mwa_sub_arrays=mwa_sub_arrays,
                 pretend=pretend,
             )
-            print(f"result: {result}")
-            decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Saving observation result. \n"
-            request_sent_at = datetime.utcnow()
-            if decision.find("T") > -1:
-                saved_obs = Observations.objects.create(
-                    trigger_id=result["trigger_id"] or random.randrange(10000, 99999),
-                    telescope=proposal_decision_model.proposal.telescope,
-                    proposal_decision_id=proposal_decision_model,
-                    reason=reason,
-                    mwa_sub_arrays=mwa_sub_arrays,
-                    website_link=f"http://ws.mwatelescope.org/observation/obs/?obsid={obsids[0]}",
-                    event=latestVoevent,
-                    mwa_response=result,
-                    request_sent_at=request_sent_at,
-                )
-                print(saved_obs)
 
-    elif proposal_decision_model.proposal.telescope.name == "ATCA":
+    elif telescope_name == "ATCA":
         # Check if you can observe and if so send off mwa observation
-        obsname = f"{proposal_decision_model.trig_id}"
-        decision, decision_reason_log, obsids = trigger_atca_observation(
+        obsname = f"{trig_id}"
+        decision, atca_reason_log, obsids = trigger_atca_observation(
             proposal_decision_model,
-            decision_reason_log,
+            "",
             obsname,
             event_id=event_id,
         )
+        reason_log.write(atca_reason_log)
         for obsid in obsids:
             # Create new obsid model
             Observations.objects.create(
                 trigger_id=obsid,
-                telescope=proposal_decision_model.proposal.telescope,
+                telescope=proposal.telescope,
                 proposal_decision_id=proposal_decision_model,
                 reason=reason,
                 event=latestVoevent,
@@ -571,8 +638,10 @@ def trigger_observation(
                 # website_link=f"http://ws.mwatelescope.org/observation/obs/?obsid={obsid}",
             )
     else:
-        decision_reason_log = f"{decision_reason_log}{datetime.utcnow()}: Event ID {event_id}: Not making an MWA observation. \n"
-    return decision, decision_reason_log
+        reason_log.write(
+            f"{now}: Event ID {event_id}: Not making an MWA observation. \n"
+        )
+    return decision, reason_log.getvalue()
 
 
 def trigger_mwa_observation(
@@ -612,15 +681,14 @@ def trigger_mwa_observation(
         Result from mwa
     """
     prop_settings = proposal_decision_model.proposal
-    print("DEBUG - triggering MWA")
-    print(f"DEBUG - proposal: {prop_settings.__dict__}")
+    logger.debug("triggering MWA")
+    logger.debug("proposal: %s", prop_settings.__dict__)
     # Not below horizon limit so observer
-    logger.info(f"Triggering MWA at UTC time {Time.now()} ...")
+    logger.info("Triggering MWA at UTC time %s ...", Time.now())
     # Handle early warning events without position using sub arrays
     try:
-        if prop_settings.source_type == "GW" and buffered == True and vcsmode == True:
-            print("DEBUG - Dumping buffer")
-            print("DEBUG - Using nobs = 1, exptime = 8")
+        if prop_settings.source_type == "GW" and buffered and vcsmode:
+            logger.debug("Dumping buffer using nobs = 1, exptime = 8")
 
             result = trigger(
                 project_id=prop_settings.project_id.id,
@@ -638,10 +706,10 @@ def trigger_mwa_observation(
                 vcsmode=vcsmode,
                 buffered=buffered,
             )
-            print(f"buffered result: {result}")
+            logger.debug("buffered result: %s", result)
 
         elif prop_settings.source_type == "GW" and mwa_sub_arrays != None:
-            print("DEBUG - Scheduling an ra/dec sub array observation")
+            logger.debug("Scheduling an ra/dec sub array observation")
 
             result = trigger(
                 project_id=prop_settings.project_id.id,
@@ -664,7 +732,7 @@ def trigger_mwa_observation(
                 vcsmode=vcsmode,
             )
         else:
-            print("DEBUG - Scheduling an ra/dec observation")
+            logger.debug("Scheduling an ra/dec observation")
 
             result = trigger(
                 project_id=prop_settings.project_id.id,
@@ -688,34 +756,36 @@ def trigger_mwa_observation(
                 vcsmode=vcsmode,
             )
     except Exception as e:
-        print(f"DEGUB - Error exception scheduling observation {e}")
+        logger.error("Error exception scheduling observation %s", e)
         decision_reason_log += f"{datetime.utcnow()}: Event ID {event_id}: Exception trying to schedule event {e}\n "
         return "E", decision_reason_log, [], []
 
-    print(f"result: {result}")
-    logger.debug(f"result: {result}")
+    logger.debug("result: %s", result)
     # Check if succesful
     if result is None:
-        print("DEBUG - Error: no result from scheduling observation")
+        logger.debug("Error: no result from scheduling observation")
         decision_reason_log += f"{datetime.utcnow()}: Event ID {event_id}: Web API error, possible server error.\n "
         return "E", decision_reason_log, [], result
     if not result["success"]:
-        print("DEBUG - Error: failed to schedule observation")
+        logger.debug("Error: failed to schedule observation")
         # Observation not succesful so record why
-        for err_id in result["errors"]:
-            decision_reason_log += f"{datetime.utcnow()}: Event ID {event_id}: {result['errors'][err_id]}.\n "
+        now = datetime.utcnow()
+        decision_reason_log += "".join(
+            f"{now}: Event ID {event_id}: {error}.\n "
+            for error in result["errors"].values()
+        )
         # Return an error as the trigger status
         return "E", decision_reason_log, [], result
 
     # Output the results
-    logger.info(f"Trigger sent: {result['success']}")
-    logger.info(f"Trigger params: {result['success']}")
+    logger.info("Trigger sent: %s", result["success"])
+    logger.info("Trigger params: %s", result["success"])
     if "stdout" in result["schedule"].keys():
         if result["schedule"]["stdout"]:
-            logger.info(f"schedule' stdout: {result['schedule']['stdout']}")
+            logger.info("schedule' stdout: %s", result["schedule"]["stdout"])
     if "stderr" in result["schedule"].keys():
         if result["schedule"]["stderr"]:
-            logger.info(f"schedule' stderr: {result['schedule']['stderr']}")
+            logger.info("schedule' stderr: %s", result["schedule"]["stderr"])
 
     # Grab the obsids (sometimes we will send of several observations)
     obsids = []
@@ -726,10 +796,87 @@ def trigger_mwa_observation(
             if r.startswith("INFO:Schedule metadata for"):
                 obsids.append(r.split(" for ")[1][:-1])
             elif r.startswith("Pretending: commands not run"):
-                obsids.append(f"P{random.randint(1000,9999)}")
+                obsids.append(f"P{next_fallback_trigger_id()}")
     return "T", decision_reason_log, obsids, result
 
 
+def trigger_and_save_mwa_observation(
+    proposal_decision_model,
+    reason_log,
+    obsname,
+    latestVoevent,
+    reason,
+    vcsmode=False,
+    event_id=None,
+    mwa_sub_arrays=None,
+    buffered=False,
+    pretend=False,
+    save_message="Saving observation result.",
+):
+    """Send off an MWA observation with trigger_mwa_observation and record it in the Observations model if it was triggered.
+
+    Parameters
+    ----------
+    proposal_decision_model : `django.db.models.Model`
+        The Django ProposalDecision model object.
+    reason_log : `io.StringIO`
+        A buffer of all the decisions made so far so a user can understand why the source was(n't) observed. The save message is written to it.
+    obsname : `str`
+        The name of the observation.
+    latestVoevent : `django.db.models.Model`
+        The Django Event model object the observation will be linked to.
+    reason : `str`
+        The reason for this observation that is recorded in the Observations model.
+    vcsmode : `boolean`, optional
+        True to observe in VCS mode and False to observe in correlator/imaging mode. Default: False
+    event_id : `int`, optional
+        An Event ID that will be recorded in the decision_reason_log. Default: None.
+    mwa_sub_arrays : `dict`, optional
+        The "ra" and "dec" lists of the sub array pointings. Default: None.
+    buffered : `boolean`, optional
+        True to request an MWA buffer dump. Default: False.
+    pretend : `boolean`, optional
+        True to only pretend to schedule the observation. Default: False.
+    save_message : `str`, optional
+        The message recorded in the decision_reason_log before saving. Default: "Saving observation result.".
+
+    Returns
+    -------
+    decision : `str`
+        The results of the attempt to observer where 'T' means it was triggered, 'I' means it was ignored and 'E' means there was an error.
+    obsids : `list`
+        A list of observations that were scheduled by MWA.
+    result : `object`
+        Result from mwa
+    """
+    request_sent_at = datetime.utcnow()
+    decision, decision_reason_log_obs, obsids, result = trigger_mwa_observation(
+        proposal_decision_model,
+        "",
+        obsname,
+        vcsmode=vcsmode,
+        event_id=event_id,
+        mwa_sub_arrays=mwa_sub_arrays,
+        buffered=buffered,
+        pretend=pretend,
+    )
+    logger.debug("result: %s", result)
+    reason_log.write(f"{datetime.utcnow()}: Event ID {event_id}: {save_message} \n")
+    if "T" in decision:
+        Observations.objects.create(
+            trigger_id=result["trigger_id"] or next_fallback_trigger_id(),
+            telescope=proposal_decision_model.proposal.telescope,
+            proposal_decision_id=proposal_decision_model,
+            reason=reason,
+            website_link=f"http://ws.mwatelescope.org/observation/obs/?obsid={obsids[0]}",
+            mwa_sub_arrays=mwa_sub_arrays,
+            event=latestVoevent,
+            mwa_response=result,
+            request_sent_at=request_sent_at,
+        )
+    return decision, obsids, result
+
+
 def trigger_atca_observation(
     proposal_decision_model,
     decision_reason_log,
@@ -761,9 +908,9 @@ def trigger_atca_observation(
     prop_obj = proposal_decision_model.proposal
 
     # TODO add any schedule checks or observation parsing here
-    print("DEBUG - trigger_atca_observation")
+    logger.debug("trigger_atca_observation")
     # Not below horizon limit so observer
-    logger.info(f"Triggering  ATCA at UTC time {Time.now()} ...")
+    logger.info("Triggering  ATCA at UTC time %s ...", Time.now())
 
     rq = {
         "source": prop_obj.source_type,
@@ -811,14 +958,13 @@ def trigger_atca_observation(
     rapidObj = {"requestDict": rq}
     rapidObj["authenticationToken"] = prop_obj.project_id.password
     rapidObj["email"] = prop_obj.project_id.atca_email
-    trigger_real_pretend = TRIGGER_ON[0][0]
 
     user = ATCAUser.objects.all().first()
 
     rapidObj["httpAuthUsername"] = user.httpAuthUsername
     rapidObj["httpAuthPassword"] = user.httpAuthPassword
 
-    if prop_obj.testing == trigger_real_pretend:
+    if prop_obj.testing == TRIGGER_REAL_PRETEND:
         rapidObj["test"] = True
         rapidObj["noTimeLimit"] = True
         rapidObj["noScoreLimit"] = True
@@ -827,7 +973,7 @@ def trigger_atca_observation(
     try:
         response = request.send()
     except Exception as r:
-        logger.error(f"ATCA error message: {r}")
+        logger.error("ATCA error message: %s", r)
         decision_reason_log += (
             f"{datetime.utcnow()}: Event ID {event_id}: ATCA error message: {r}\n "
         )
@@ -386,6 +386,58 @@ class test_grb_group_swift_2(TestCase):
         self.assertEqual(len(Observations.objects.filter(telescope="ATCA")), 1)
 
 
+class test_grb_followup_without_position(TestCase):
+    """Tests a follow up event without a position doesn't re-trigger an observed event"""
+
+    # Load default fixtures
+    fixtures = [
+        "default_data.yaml",
+        "trigger_app/test_yamls/mwa_grb_proposal_settings.yaml",
+    ]
+
+    with open("trigger_app/test_yamls/trigger_mwa_test.yaml", "r") as file:
+        trigger_mwa_test = safe_load(file)
+
+    @patch("trigger_app.telescope_observe.trigger", return_value=trigger_mwa_test)
+    def setUp(self, fake_mwa_api):
+        xml_paths = [
+            "../tests/test_events/group_01_01_Fermi.xml",
+            "../tests/test_events/group_01_02_Fermi.xml",
+        ]
+
+        # Setup current RA and Dec at zenith for the MWA
+        MWA = EarthLocation(lat="-26:42:11.95", lon="116:40:14.93", height=377.8 * u.m)
+        mwa_coord = SkyCoord(
+            az=0.0,
+            alt=90.0,
+            unit=(u.deg, u.deg),
+            frame="altaz",
+            obstime=Time.now(),
+            location=MWA,
+        )
+        ra_dec = mwa_coord.icrs
+
+        # Upload the first event with a position and the follow up without one
+        create_voevent_wrapper(parsed_VOEvent(xml_paths[0]), ra_dec)
+        create_voevent_wrapper(parsed_VOEvent(xml_paths[1]), None)
+
+    def test_trigger_groups(self):
+        self.assertEqual(len(Event.objects.all()), 2)
+        self.assertEqual(len(EventGroup.objects.all()), 1)
+
+    def test_mwa_proposal_decision(self):
+        proposal_decision = ProposalDecision.objects.filter(
+            proposal__telescope__name="MWA_VCS"
+        ).first()
+        self.assertEqual(proposal_decision.decision, "T")
+        self.assertIn(
+            "New event has no position so not repointing",
+            proposal_decision.decision_reason,
+        )
+        # Only the first event was observed
+        self.assertEqual(len(Observations.objects.filter(telescope="MWA_VCS")), 1)
+
+
 class test_grb_observation_fail_atca(TestCase):
     """Tests what happens if ATCA fails to schedule an observation"""
 
@@ -1,5 +1,6 @@
 from django.test import TestCase
 from trigger_app.utils import getMWAPointingsFromSkymapFile, isClosePosition
+from trigger_app.telescope_observe import get_skymap_sub_arrays, should_repoint
 from astropy import units as u
 from astropy.table import Table
 from astropy.coordinates import SkyCoord, EarthLocation
@@ -48,3 +49,32 @@ class test_skymap_parsing_to_mwa(TestCase):
         )
 
         self.assertEqual(result2, False)
+
+
+class test_skymap_sub_arrays(TestCase):
+    """Tests the MWA sub arrays are only made from skymaps with enough pointings"""
+
+    def setUp(self):
+        # Pointings in the same format as getMWAPointingsFromSkymapFile
+        self.pointings = [
+            (None, None, None, ra * u.deg, -30.0 * u.deg)
+            for ra in (10.0, 20.0, 30.0, 40.0)
+        ]
+
+    def test_four_pointings(self):
+        result = get_skymap_sub_arrays(self.pointings)
+        self.assertEqual(result["ra"], [10.0, 20.0, 30.0, 40.0])
+        self.assertEqual(result["dec"], [-30.0, -30.0, -30.0, -30.0])
+
+    def test_too_few_pointings(self):
+        with self.assertRaises(ValueError):
+            get_skymap_sub_arrays(self.pointings[:3])
+
+    def test_should_repoint(self):
+        # New pointings far from the current sub arrays
+        self.assertTrue(should_repoint([100.0], [30.0], self.pointings))
+        # A new pointing close to a current sub array
+        self.assertFalse(should_repoint([12.0], [-30.0], self.pointings))
+
+    def test_should_not_repoint_without_current_pointings(self):
+        self.assertFalse(should_repoint([], [], self.pointings))
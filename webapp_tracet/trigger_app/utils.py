@@ -12,6 +12,9 @@ import numpy as np
 import pathlib
 from matplotlib import pyplot as plt
 from typing import Tuple, TypeVar, List
+import logging
+
+logger = logging.getLogger(__name__)
 
 filepath = pathlib.Path(__file__).resolve().parent
 
@@ -46,10 +49,10 @@ def isClosePosition(ra1, dec1, ra2, dec2, deg=10):
 
     # Check if the angular separation is within 10 degrees
     if angular_sep < deg * u.deg:
-        print("The positions are within 10 degrees.")
+        logger.debug("The positions are within %s degrees.", deg)
         return True
     else:
-        print("The positions are more than 10 degrees apart.")
+        logger.debug("The positions are more than %s degrees apart.", deg)
         return False
 
 